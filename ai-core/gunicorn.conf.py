@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for VectorOS AI Core
+
+Runs uvicorn workers under a gunicorn master. Read-only data (the embedding
+model) is loaded once in the master before forking so workers share it
+copy-on-write; network clients (Anthropic, httpx, Qdrant, Redis) are still
+created per worker in the FastAPI lifespan since sockets can't be shared
+across processes.
+
+Usage: gunicorn -c gunicorn.conf.py src.main:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"  # Picks uvloop + httptools (installed via requirements)
+timeout = 180  # Above settings.ai_timeout so slow LLM calls aren't killed
+graceful_timeout = 30
+keepalive = 5
+
+# Tokenizer thread pools don't survive fork - keep them off in workers
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+
+def when_ready(server):
+    """Preload shared read-only data in the master, before workers are forked"""
+    from src.config import settings
+
+    if settings.enable_intelligent_insights:
+        from src.services.memory_service import get_embedding_model
+
+        get_embedding_model()
+        server.log.info("Embedding model preloaded for copy-on-write sharing")
@@ -0,0 +1,75 @@
+"""
+Shared Anthropic clients for agents
+One connection pool per process instead of one per agent instance
+"""
+from functools import lru_cache
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
+from langchain_anthropic import ChatAnthropic
+
+from ..config import settings
+
+
+@lru_cache(maxsize=1)
+def get_anthropic() -> Anthropic:
+    """Get the process-wide Anthropic client"""
+    return Anthropic(
+        api_key=settings.anthropic_api_key,
+        http_client=httpx.Client(
+            timeout=settings.ai_timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async connection pool used for LLM calls"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=settings.ai_timeout,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_anthropic() -> AsyncAnthropic:
+    """Get the process-wide async Anthropic client (on the shared connection pool)"""
+    return AsyncAnthropic(
+        api_key=settings.anthropic_api_key,
+        http_client=get_async_http_client(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_chat_anthropic(model: str, temperature: float, max_tokens: int) -> ChatAnthropic:
+    """Get a shared ChatAnthropic for a model/temperature/max_tokens combination"""
+    llm = ChatAnthropic(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        anthropic_api_key=settings.anthropic_api_key,
+        timeout=settings.ai_timeout,
+    )
+
+    # ChatAnthropic builds its own AsyncAnthropic (and connection pool) per
+    # instance and has no option to inject one - swap in the shared client so
+    # concurrent calls reuse warm connections instead of new TLS handshakes.
+    # langchain-anthropic 0.1.x (a pydantic-v1 model) keeps the client in the
+    # instance __dict__ and rejects normal assignment to non-fields, so write it
+    # directly; on layouts without that slot, keep ChatAnthropic's own client.
+    if "_async_client" in llm.__dict__:
+        object.__setattr__(llm, "_async_client", get_async_anthropic())
+
+    return llm
+
+
+async def aclose_clients() -> None:
+    """Close the shared async connection pool (call once on shutdown)"""
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
+
+    get_chat_anthropic.cache_clear()
+    get_async_anthropic.cache_clear()
+    get_async_http_client.cache_clear()
@@ -14,13 +14,78 @@ The agent runs 24/7 in the background:
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Deal columns read by the monitoring cycle (DealView fields + workspaceId for
+# bucketing). Add a column here when a new check needs it - anything not listed
+# is not fetched.
+DEAL_MONITOR_SELECT = {
+    "id": True,
+    "title": True,
+    "value": True,
+    "stage": True,
+    "probability": True,
+    "company": True,
+    "contactName": True,
+    "contactEmail": True,
+    "closeDate": True,
+    "createdAt": True,
+    "updatedAt": True,
+    "workspaceId": True,
+}
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# How long an emitted insight suppresses an identical one for the same deal
+INSIGHT_DEDUP_TTL_SECONDS = 3 * 24 * 60 * 60
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a DB datetime to aware UTC (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
+class AgentConfig:
+    """Autonomous agent settings (adjustable at runtime via update_config)."""
+    enabled: bool = False
+    check_interval_minutes: int = 30  # How often to check deals
+    high_confidence_threshold: float = 0.85  # 85%+ = take action
+    medium_confidence_threshold: float = 0.70  # 70%+ = create recommendation
+    at_risk_threshold: float = 0.30  # < 30% win probability = at risk
+    stale_days: int = 7  # Days without update = stale
+
+
+@dataclass(slots=True)
+class DealView:
+    """Fields of a deal the monitoring checks read."""
+    id: str
+    title: str
+    value: Optional[float]
+    stage: str
+    probability: Optional[int]
+    company: Optional[str]
+    contact_name: Optional[str]
+    contact_email: Optional[str]
+    close_date: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
 
 class AutonomousAgent:
     """
@@ -59,17 +124,22 @@ class AutonomousAgent:
         self.cache = cache_service
 
         # Agent configuration
-        self.config = {
-            "enabled": False,
-            "check_interval_minutes": 30,  # How often to check deals
-            "high_confidence_threshold": 0.85,  # 85%+ = take action
-            "medium_confidence_threshold": 0.70,  # 70%+ = create recommendation
-            "at_risk_threshold": 0.30,  # < 30% win probability = at risk
-            "stale_days": 7,  # Days without update = stale
-        }
-
-        # Scheduler for background jobs
-        self.scheduler = AsyncIOScheduler()
+        self.config = AgentConfig()
+
+        # Insights raised during a monitoring cycle as (dedup key, row) pairs,
+        # written in one batch at the end of the cycle
+        self._pending_insights: List[Tuple[Optional[str], Dict[str, Any]]] = []
+
+        # Deal checks in flight across all workspaces, bounded by the DB pool
+        # size so concurrent workspace sweeps can't exhaust connections
+        self._db_slots = asyncio.Semaphore(settings.db_pool_size)
+
+        # Monitoring runs as a task on the app's event loop - the Prisma and
+        # cache clients it uses were created (and connected) on that loop
+        self._runner_task: Optional[asyncio.Task] = None
+        self._reschedule: Optional[asyncio.Event] = None  # Set when the interval changes
+        self._next_run: Optional[datetime] = None
+        self._cycle_now: Optional[datetime] = None  # Clock reading shared by the current/last cycle
         self.is_running = False
 
         logger.info("Autonomous agent initialized (disabled by default)")
@@ -78,6 +148,8 @@ class AutonomousAgent:
         """
         Start the autonomous agent.
 
+        Must be called from the app's event loop (e.g. in an endpoint or lifespan).
+
         Args:
             interval_minutes: How often to run monitoring cycle
         """
@@ -85,19 +157,11 @@ class AutonomousAgent:
             logger.warning("Agent already running")
             return
 
-        self.config["check_interval_minutes"] = interval_minutes
-        self.config["enabled"] = True
+        self.config.check_interval_minutes = interval_minutes
+        self.config.enabled = True
 
-        # Schedule monitoring job
-        self.scheduler.add_job(
-            self._monitoring_cycle,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            id="deal_monitoring",
-            name="Autonomous Deal Monitoring",
-            replace_existing=True
-        )
-
-        self.scheduler.start()
+        self._reschedule = asyncio.Event()
+        self._runner_task = asyncio.create_task(self._runner(), name="autonomous-agent")
         self.is_running = True
 
         logger.info(f"🤖 Autonomous agent STARTED - checking every {interval_minutes} minutes")
@@ -108,12 +172,59 @@ class AutonomousAgent:
             logger.warning("Agent not running")
             return
 
-        self.scheduler.shutdown(wait=False)
+        self.config.enabled = False
+        self._runner_task.cancel()
+        self._runner_task = None
+        self._next_run = None
         self.is_running = False
-        self.config["enabled"] = False
 
         logger.info("🛑 Autonomous agent STOPPED")
 
+    async def _runner(self):
+        """
+        Run a monitoring cycle every check interval until disabled.
+
+        Ticks are scheduled off a monotonic clock so they don't drift with cycle
+        duration. If a cycle overruns, missed ticks are skipped rather than
+        run back to back. The interval is re-read every tick, and a change via
+        update_config() reschedules the pending tick immediately.
+        """
+        last_tick = time.monotonic()
+
+        while self.config.enabled:
+            interval = self.config.check_interval_minutes * 60
+            next_tick = last_tick + interval
+            behind = time.monotonic() - next_tick
+            if behind > 0:
+                next_tick += (behind // interval + 1) * interval
+
+            delay = max(0.0, next_tick - time.monotonic())
+            self._next_run = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+            self._reschedule.clear()
+            try:
+                await asyncio.wait_for(self._reschedule.wait(), timeout=delay)
+                continue  # Interval changed - recompute the tick from last_tick
+            except asyncio.TimeoutError:
+                pass
+
+            last_tick = next_tick
+            await self._run_cycle()
+
+    async def _run_cycle(self):
+        """
+        Run one monitoring cycle with a watchdog.
+
+        A cycle is cut off at 90% of the interval so a slow sweep can never
+        overlap the next one.
+        """
+        timeout = self.config.check_interval_minutes * 60 * 0.9
+
+        try:
+            await asyncio.wait_for(self._monitoring_cycle(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Monitoring cycle exceeded {timeout:.0f}s - cancelled")
+
     async def _monitoring_cycle(self):
         """
         Main monitoring cycle - runs periodically.
@@ -127,66 +238,205 @@ class AutonomousAgent:
         """
         logger.info("🧠 Starting autonomous monitoring cycle...")
 
+        self._pending_insights = []
+
+        # Snapshot thresholds once per cycle
+        now = self._cycle_now = datetime.now(timezone.utc)
+        stale_days = self.config.stale_days
+        at_risk_threshold = self.config.at_risk_threshold
+
         try:
             # Get all active workspaces
             workspaces = await self.db.workspace.findMany({
-                "where": {"deals": {"some": {}}}  # Has at least one deal
+                "where": {"deals": {"some": {}}},  # Has at least one deal
+                "select": {"id": True}
             })
+            workspace_ids = [workspace.id for workspace in workspaces]
 
-            total_actions = 0
+            # Fetch active deals (not won/lost) for every workspace in one query
+            # instead of one round-trip per workspace, then bucket them locally.
+            # Only deals that could trip at least one check are returned.
+            active_deals = await self.db.deal.findMany({
+                "where": {
+                    "workspaceId": {"in": workspace_ids},
+                    "stage": {
+                        "not_in": ["won", "lost"]
+                    },
+                    "OR": self._candidate_filters(now, stale_days, at_risk_threshold)
+                },
+                "select": DEAL_MONITOR_SELECT
+            }) if workspace_ids else []
 
-            for workspace in workspaces:
-                actions = await self._monitor_workspace(workspace.id)
-                total_actions += actions
+            deals_by_workspace: Dict[str, List[Any]] = defaultdict(list)
+            for deal in active_deals:
+                deals_by_workspace[deal.workspaceId].append(deal)
+
+            # Sweep workspaces concurrently; _db_slots caps the deal checks in
+            # flight across all of them
+            results = await asyncio.gather(*(
+                self._monitor_workspace(
+                    workspace_id,
+                    deals_by_workspace.get(workspace_id, []),
+                    now,
+                    stale_days,
+                    at_risk_threshold
+                )
+                for workspace_id in workspace_ids
+            ))
+            total_actions = sum(results)
 
             logger.info(f"✅ Monitoring cycle complete - took {total_actions} actions")
 
         except Exception as e:
             logger.error(f"❌ Monitoring cycle error: {e}")
 
-    async def _monitor_workspace(self, workspace_id: str) -> int:
+        finally:
+            await self._flush_insights()
+
+    @staticmethod
+    def _candidate_filters(
+        now: datetime,
+        stale_days: int,
+        at_risk_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the DB-side predicates matching the per-deal checks.
+
+        Mirrors the thresholds in the _check_* methods so healthy deals are
+        filtered out by the (workspaceId, stage, ...) indexes instead of in Python.
+
+        Args:
+            now: Cycle timestamp
+            stale_days: Days without update before a deal is stale
+            at_risk_threshold: Win probability (0-1) below which a deal is at risk
+
+        Returns:
+            List of Prisma where clauses to OR together
+        """
+        # probability is an Int column and Prisma rejects float filters on it;
+        # rounding up keeps every deal the Python check could flag
+        at_risk_probability = math.ceil(at_risk_threshold * 100)
+
+        return [
+            # Stale: no update for stale_days
+            {"updatedAt": {"lte": now - timedelta(days=stale_days)}},
+            # At risk: low win probability
+            {"probability": {"lt": at_risk_probability}},
+            # Closing soon: 1-7 whole days out
+            {"closeDate": {"gte": now + timedelta(days=1), "lt": now + timedelta(days=8)}},
+            # Opportunity: high value and high probability
+            {"value": {"gt": 50000}, "probability": {"gt": 75}},
+        ]
+
+    @staticmethod
+    def _threshold_masks(
+        deals: List[Any],
+        now: datetime,
+        stale_days: int,
+        at_risk_threshold: float
+    ) -> np.ndarray:
+        """
+        Evaluate every check's threshold over a batch of deals at once.
+
+        The masks are a vectorized pre-pass - the _check_* methods still make the
+        final call, so a mask only needs to never miss a deal a check would flag.
+
+        Args:
+            deals: Deals to evaluate
+            now: Cycle timestamp
+            stale_days: Days without update before a deal is stale
+            at_risk_threshold: Win probability (0-1) below which a deal is at risk
+
+        Returns:
+            (len(deals), 4) bool array - columns are stale, at-risk,
+            opportunity, closing soon
+        """
+        count = len(deals)
+        now_ts = now.timestamp()
+
+        probability = np.fromiter((d.probability or 50 for d in deals), dtype=np.float64, count=count)
+        value = np.fromiter((d.value or 0 for d in deals), dtype=np.float64, count=count)
+        updated = np.fromiter((_as_utc(d.updatedAt).timestamp() for d in deals), dtype=np.float64, count=count)
+        close = np.fromiter(
+            (_as_utc(d.closeDate).timestamp() if d.closeDate else np.nan for d in deals),
+            dtype=np.float64,
+            count=count
+        )
+
+        seconds_to_close = close - now_ts  # NaN (no close date) compares False
+
+        return np.column_stack((
+            now_ts - updated >= stale_days * SECONDS_PER_DAY,
+            probability < at_risk_threshold * 100,
+            (value > 50000) & (probability > 75),
+            (seconds_to_close >= SECONDS_PER_DAY) & (seconds_to_close < 8 * SECONDS_PER_DAY),
+        ))
+
+    async def _monitor_workspace(
+        self,
+        workspace_id: str,
+        active_deals: List[Any],
+        now: datetime,
+        stale_days: int,
+        at_risk_threshold: float
+    ) -> int:
         """
         Monitor all deals in a workspace.
 
         Args:
             workspace_id: Workspace to monitor
+            active_deals: Active (not won/lost) deals belonging to the workspace
+            now: Cycle timestamp
+            stale_days: Days without update before a deal is stale
+            at_risk_threshold: Win probability (0-1) below which a deal is at risk
 
         Returns:
             Number of actions taken
         """
         try:
-            # Get all active deals (not won/lost)
-            active_deals = await self.db.deal.findMany({
-                "where": {
-                    "workspaceId": workspace_id,
-                    "stage": {
-                        "not_in": ["won", "lost"]
-                    }
-                }
-            })
-
             logger.info(f"Monitoring {len(active_deals)} active deals in workspace {workspace_id}")
 
-            actions_taken = 0
+            flags = self._threshold_masks(active_deals, now, stale_days, at_risk_threshold)
+            flagged = flags.any(axis=1)
 
-            for deal in active_deals:
-                # Check each deal
-                deal_actions = await self._check_deal(deal, workspace_id)
-                actions_taken += deal_actions
+            # Check deals concurrently; the shared semaphore bounds DB work
+            # across all workspaces being monitored at once
+            async def check(deal: Any, deal_flags: np.ndarray) -> int:
+                async with self._db_slots:
+                    return await self._check_deal(
+                        deal, workspace_id, now, stale_days, at_risk_threshold, deal_flags
+                    )
 
-            return actions_taken
+            results = await asyncio.gather(*(
+                check(active_deals[index], flags[index])
+                for index in np.flatnonzero(flagged)
+            ))
+
+            return sum(results)
 
         except Exception as e:
             logger.error(f"Workspace monitoring error: {e}")
             return 0
 
-    async def _check_deal(self, deal: Any, workspace_id: str) -> int:
+    async def _check_deal(
+        self,
+        deal: Any,
+        workspace_id: str,
+        now: datetime,
+        stale_days: int,
+        at_risk_threshold: float,
+        flags: np.ndarray
+    ) -> int:
         """
         Check a single deal for issues and opportunities.
 
         Args:
             deal: Deal to check
             workspace_id: Workspace context
+            now: Cycle timestamp
+            stale_days: Days without update before a deal is stale
+            at_risk_threshold: Win probability (0-1) below which a deal is at risk
+            flags: This deal's row from _threshold_masks - only flagged checks run
 
         Returns:
             Number of actions taken
@@ -194,56 +444,78 @@ class AutonomousAgent:
         actions = 0
 
         try:
-            # Convert deal to dict
-            deal_dict = {
-                "id": deal.id,
-                "title": deal.title,
-                "value": deal.value,
-                "stage": deal.stage,
-                "probability": deal.probability,
-                "company": deal.company,
-                "contactName": deal.contactName,
-                "contactEmail": deal.contactEmail,
-                "closeDate": deal.closeDate.isoformat() if deal.closeDate else None,
-                "createdAt": deal.createdAt.isoformat(),
-                "updatedAt": deal.updatedAt.isoformat(),
-            }
-
-            # Run checks
-            actions += await self._check_stale_deal(deal_dict, workspace_id)
-            actions += await self._check_at_risk(deal_dict, workspace_id)
-            actions += await self._check_opportunity(deal_dict, workspace_id)
-            actions += await self._check_closing_soon(deal_dict, workspace_id)
+            # Snapshot the fields the checks read
+            view = DealView(
+                id=deal.id,
+                title=deal.title,
+                value=deal.value,
+                stage=deal.stage,
+                probability=deal.probability,
+                company=deal.company,
+                contact_name=deal.contactName,
+                contact_email=deal.contactEmail,
+                close_date=_as_utc(deal.closeDate),
+                created_at=_as_utc(deal.createdAt),
+                updated_at=_as_utc(deal.updatedAt),
+            )
+
+            stale, at_risk, opportunity, closing_soon = flags
+
+            checks = []
+            if stale:
+                checks.append(self._check_stale_deal(view, workspace_id, now, stale_days))
+            if at_risk:
+                checks.append(self._check_at_risk(view, workspace_id, at_risk_threshold))
+            if opportunity:
+                checks.append(self._check_opportunity(view, workspace_id))
+            if closing_soon:
+                checks.append(self._check_closing_soon(view, workspace_id, now))
+
+            # Run checks concurrently - they are independent of each other
+            results = await asyncio.gather(*checks, return_exceptions=True)
+
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Deal check error for {deal.id}: {result}")
+                else:
+                    actions += result
 
         except Exception as e:
             logger.error(f"Deal check error for {deal.id}: {e}")
 
         return actions
 
-    async def _check_stale_deal(self, deal: Dict, workspace_id: str) -> int:
+    async def _check_stale_deal(
+        self,
+        deal: DealView,
+        workspace_id: str,
+        now: datetime,
+        stale_days: int
+    ) -> int:
         """Check if deal has gone stale (no recent activity)."""
         try:
-            updated_at = datetime.fromisoformat(deal["updatedAt"].replace('Z', '+00:00'))
-            days_since_update = (datetime.now(updated_at.tzinfo) - updated_at).days
+            days_since_update = (now - deal.updated_at).days
 
-            if days_since_update >= self.config["stale_days"]:
+            if days_since_update >= stale_days:
                 # Deal is stale - create alert
                 await self._create_insight(
                     workspace_id=workspace_id,
                     insight_type="warning",
-                    title=f"Stale Deal: {deal['title']}",
+                    title=f"Stale Deal: {deal.title}",
                     description=f"No activity for {days_since_update} days. Risk of losing momentum.",
                     priority="high",
                     confidence=0.95,  # High confidence this is an issue
-                    data={"deal_id": deal["id"], "days_stale": days_since_update},
+                    data={"deal_id": deal.id, "days_stale": days_since_update},
                     actions=[
                         "Schedule follow-up call with contact",
                         "Send re-engagement email",
                         "Review if deal is still viable"
-                    ]
+                    ],
+                    # Re-alert only once the deal has gone another 3 days stale
+                    dedup_key=f"stale:{days_since_update // 3}"
                 )
 
-                logger.info(f"🚨 Created stale deal alert for {deal['title']}")
+                logger.info(f"🚨 Created stale deal alert for {deal.title}")
                 return 1
 
         except Exception as e:
@@ -251,30 +523,36 @@ class AutonomousAgent:
 
         return 0
 
-    async def _check_at_risk(self, deal: Dict, workspace_id: str) -> int:
+    async def _check_at_risk(
+        self,
+        deal: DealView,
+        workspace_id: str,
+        at_risk_threshold: float
+    ) -> int:
         """Check if deal is at risk of being lost."""
         try:
-            probability = (deal.get("probability") or 50) / 100.0
+            probability = (deal.probability or 50) / 100.0
 
-            if probability < self.config["at_risk_threshold"]:
+            if probability < at_risk_threshold:
                 # Deal is at risk - high priority
                 await self._create_insight(
                     workspace_id=workspace_id,
                     insight_type="warning",
-                    title=f"At-Risk Deal: {deal['title']}",
+                    title=f"At-Risk Deal: {deal.title}",
                     description=f"Win probability is low ({probability*100:.0f}%). Immediate action needed.",
                     priority="critical",
                     confidence=0.88,
-                    data={"deal_id": deal["id"], "win_probability": probability},
+                    data={"deal_id": deal.id, "win_probability": probability},
                     actions=[
                         "Identify and address blockers",
                         "Escalate to senior sales rep",
                         "Consider offering incentives",
                         "Re-evaluate deal qualification"
-                    ]
+                    ],
+                    dedup_key=f"at_risk:{deal.probability}"
                 )
 
-                logger.info(f"🔴 Created at-risk alert for {deal['title']}")
+                logger.info(f"🔴 Created at-risk alert for {deal.title}")
                 return 1
 
         except Exception as e:
@@ -282,32 +560,33 @@ class AutonomousAgent:
 
         return 0
 
-    async def _check_opportunity(self, deal: Dict, workspace_id: str) -> int:
+    async def _check_opportunity(self, deal: DealView, workspace_id: str) -> int:
         """Check for upsell/cross-sell opportunities."""
         try:
             # High value + high probability = opportunity
-            value = deal.get("value") or 0
-            probability = (deal.get("probability") or 50) / 100.0
+            value = deal.value or 0
+            probability = (deal.probability or 50) / 100.0
 
             if value > 50000 and probability > 0.75:
                 # Great opportunity for upsell
                 await self._create_insight(
                     workspace_id=workspace_id,
                     insight_type="recommendation",
-                    title=f"Upsell Opportunity: {deal['title']}",
+                    title=f"Upsell Opportunity: {deal.title}",
                     description=f"High-value deal (${value:,.0f}) with strong win probability ({probability*100:.0f}%).",
                     priority="medium",
                     confidence=0.82,
-                    data={"deal_id": deal["id"], "value": value, "probability": probability},
+                    data={"deal_id": deal.id, "value": value, "probability": probability},
                     actions=[
                         "Present premium package options",
                         "Introduce additional products/services",
                         "Discuss multi-year contracts",
                         "Offer bundled pricing"
-                    ]
+                    ],
+                    dedup_key=f"opportunity:{deal.probability}"
                 )
 
-                logger.info(f"💰 Created upsell opportunity for {deal['title']}")
+                logger.info(f"💰 Created upsell opportunity for {deal.title}")
                 return 1
 
         except Exception as e:
@@ -315,34 +594,34 @@ class AutonomousAgent:
 
         return 0
 
-    async def _check_closing_soon(self, deal: Dict, workspace_id: str) -> int:
+    async def _check_closing_soon(self, deal: DealView, workspace_id: str, now: datetime) -> int:
         """Check if deal is closing soon and needs attention."""
         try:
-            if not deal.get("closeDate"):
+            if not deal.close_date:
                 return 0
 
-            close_date = datetime.fromisoformat(deal["closeDate"].replace('Z', '+00:00'))
-            days_to_close = (close_date - datetime.now(close_date.tzinfo)).days
+            days_to_close = (deal.close_date - now).days
 
             # Closing within 7 days
             if 0 < days_to_close <= 7:
                 await self._create_insight(
                     workspace_id=workspace_id,
                     insight_type="recommendation",
-                    title=f"Closing Soon: {deal['title']}",
+                    title=f"Closing Soon: {deal.title}",
                     description=f"Deal closes in {days_to_close} days. Ensure all steps are complete.",
                     priority="high",
                     confidence=1.0,  # This is a fact
-                    data={"deal_id": deal["id"], "days_to_close": days_to_close},
+                    data={"deal_id": deal.id, "days_to_close": days_to_close},
                     actions=[
                         "Verify all contract terms",
                         "Confirm decision makers are aligned",
                         "Prepare closing documents",
                         "Schedule final sign-off meeting"
-                    ]
+                    ],
+                    dedup_key=f"closing_soon:{days_to_close}"
                 )
 
-                logger.info(f"⏰ Created closing soon reminder for {deal['title']}")
+                logger.info(f"⏰ Created closing soon reminder for {deal.title}")
                 return 1
 
         except Exception as e:
@@ -359,10 +638,14 @@ class AutonomousAgent:
         priority: str,
         confidence: float,
         data: Dict,
-        actions: List[str]
+        actions: List[str],
+        dedup_key: Optional[str] = None
     ):
         """
-        Create an AI-generated insight.
+        Queue an AI-generated insight for the end-of-cycle batch write.
+
+        Insights with a dedup_key are dropped at flush time if the same key was
+        emitted for the deal within INSIGHT_DEDUP_TTL_SECONDS (atomic SET NX in Redis).
 
         Args:
             workspace_id: Workspace to create insight for
@@ -373,24 +656,67 @@ class AutonomousAgent:
             confidence: AI confidence (0.0-1.0)
             data: Supporting data
             actions: List of suggested actions
+            dedup_key: Check-specific key (e.g. "stale:2") identifying a repeat insight
+        """
+        if dedup_key:
+            dedup_key = f"vectoros:insight_dedup:{workspace_id}:{data['deal_id']}:{dedup_key}"
+
+        self._pending_insights.append((dedup_key, {
+            "workspaceId": workspace_id,
+            "type": insight_type,
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "confidence": confidence,
+            "data": data,
+            "actions": {"actions": actions},  # Wrap in object for JSON
+            "status": "new"
+        }))
+
+    async def _flush_insights(self) -> int:
+        """
+        Write all queued insights with a single createMany.
+
+        Falls back to per-row creates if the batch insert fails, so one bad
+        row doesn't drop the whole cycle's insights.
+
+        Returns:
+            Number of insights written
         """
+        pending, self._pending_insights = self._pending_insights, []
+
+        # Claim all dedup keys in one pipeline and drop insights already emitted.
+        # None means the cache is unavailable - fail open and write everything.
+        dedup_keys = [key for key, _ in pending if key]
+        claimed = await self.cache.set_many_if_absent(
+            dedup_keys, 1, ttl=INSIGHT_DEDUP_TTL_SECONDS
+        )
+        if claimed is not None:
+            is_new = dict(zip(dedup_keys, claimed))
+            pending = [(key, row) for key, row in pending if key is None or is_new[key]]
+
+        rows = [row for _, row in pending]
+
+        if not rows:
+            return 0
+
         try:
-            await self.db.insight.create({
-                "data": {
-                    "workspaceId": workspace_id,
-                    "type": insight_type,
-                    "title": title,
-                    "description": description,
-                    "priority": priority,
-                    "confidence": confidence,
-                    "data": data,
-                    "actions": {"actions": actions},  # Wrap in object for JSON
-                    "status": "new"
-                }
-            })
+            await self.db.insight.createMany({"data": rows})
+            logger.info(f"Wrote {len(rows)} insights")
+            return len(rows)
 
         except Exception as e:
-            logger.error(f"Failed to create insight: {e}")
+            logger.warning(f"Batch insight write failed, retrying row by row: {e}")
+
+        written = 0
+        for insight in rows:
+            try:
+                await self.db.insight.create({"data": insight})
+                written += 1
+            except Exception as e:
+                logger.error(f"Failed to create insight: {e}")
+
+        return written
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -400,17 +726,18 @@ class AutonomousAgent:
             Agent status information
         """
         return {
-            "enabled": self.config["enabled"],
+            "enabled": self.config.enabled,
             "is_running": self.is_running,
-            "check_interval_minutes": self.config["check_interval_minutes"],
+            "check_interval_minutes": self.config.check_interval_minutes,
             "configuration": {
-                "high_confidence_threshold": self.config["high_confidence_threshold"],
-                "medium_confidence_threshold": self.config["medium_confidence_threshold"],
-                "at_risk_threshold": self.config["at_risk_threshold"],
-                "stale_days": self.config["stale_days"],
+                "high_confidence_threshold": self.config.high_confidence_threshold,
+                "medium_confidence_threshold": self.config.medium_confidence_threshold,
+                "at_risk_threshold": self.config.at_risk_threshold,
+                "stale_days": self.config.stale_days,
             },
-            "next_run": self.scheduler.get_job("deal_monitoring").next_run_time.isoformat()
-            if self.is_running and self.scheduler.get_job("deal_monitoring")
+            "last_cycle_at": self._cycle_now.isoformat() if self._cycle_now else None,
+            "next_run": self._next_run.isoformat()
+            if self.is_running and self._next_run
             else None
         }
 
@@ -422,13 +749,18 @@ class AutonomousAgent:
             config_updates: Configuration updates to apply
         """
         for key, value in config_updates.items():
-            if key in self.config:
-                self.config[key] = value
+            if hasattr(self.config, key):
+                setattr(self.config, key, value)
                 logger.info(f"Updated agent config: {key} = {value}")
 
+        # Wake the runner so a new interval applies to the pending tick
+        if "check_interval_minutes" in config_updates and self._reschedule is not None:
+            self._reschedule.set()
+
 
 # Singleton instance
 _autonomous_agent: Optional[AutonomousAgent] = None
+_agent_lock = threading.Lock()
 
 
 def get_autonomous_agent(
@@ -442,12 +774,15 @@ def get_autonomous_agent(
     global _autonomous_agent
 
     if _autonomous_agent is None and all([db_client, deal_analyzer, memory_service, outcome_tracker, cache_service]):
-        _autonomous_agent = AutonomousAgent(
-            db_client,
-            deal_analyzer,
-            memory_service,
-            outcome_tracker,
-            cache_service
-        )
+        # Double-checked so concurrent first calls can't build two agents
+        with _agent_lock:
+            if _autonomous_agent is None:
+                _autonomous_agent = AutonomousAgent(
+                    db_client,
+                    deal_analyzer,
+                    memory_service,
+                    outcome_tracker,
+                    cache_service
+                )
 
     return _autonomous_agent
@@ -2,21 +2,65 @@
 Base Agent class with enterprise patterns
 Provides foundation for all specialized agents
 """
+import asyncio
+import inspect
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
 from datetime import datetime
 
+import anthropic
+import httpx
 from pydantic import BaseModel
-from anthropic import Anthropic
-from langchain_anthropic import ChatAnthropic
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
+from ._anthropic_clients import aclose_clients, get_anthropic, get_chat_anthropic
 from ..config import settings
+from ..utils.circuit_breaker import CircuitBreaker
 from ..utils.logger import LoggerMixin, ai_logger
 from ..models.schemas import AgentResult, AgentType
 
 
+# Called with each response section as soon as it has fully streamed in; may be sync or async
+PartialCallback = Callable[[dict[str, Any]], Any]
+
+# Transient Anthropic failures worth retrying (429, 5xx, timeouts, dropped connections)
+RETRYABLE_LLM_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+    httpx.TimeoutException,
+)
+
+# Shared by all agents - fails fast while Anthropic is down instead of every
+# call burning its retries
+anthropic_breaker = CircuitBreaker(
+    "anthropic",
+    fail_max=5,
+    reset_timeout=60,
+    failure_exceptions=RETRYABLE_LLM_ERRORS,
+)
+
+
+@dataclass
+class _RunState:
+    """Per-execution agent state (kept per asyncio task so concurrent runs don't mix)"""
+    tools_used: list[str] = field(default_factory=list)
+    reasoning_steps: list[str] = field(default_factory=list)
+
+
 class BaseAgent(ABC, LoggerMixin):
     """
     Abstract base class for all AI agents
@@ -41,21 +85,20 @@ class BaseAgent(ABC, LoggerMixin):
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Initialize LLM
-        self.llm = ChatAnthropic(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            anthropic_api_key=settings.anthropic_api_key,
-            timeout=settings.ai_timeout,
-        )
+        # Initialize LLM (shared across agents with the same settings)
+        self.llm = get_chat_anthropic(model, temperature, max_tokens)
 
         # Direct Anthropic client for advanced features
-        self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
+        self.anthropic_client = get_anthropic()
 
-        # Agent state
-        self.tools_used: list[str] = []
-        self.reasoning_steps: list[str] = []
+        # Structured-output runnables, one per response schema
+        self._structured_llms: dict[type[BaseModel], Any] = {}
+
+        # Agent state - a context variable so each concurrent execute() in
+        # execute_many() records its own reasoning and tool usage
+        self._run_state: ContextVar[Optional[_RunState]] = ContextVar(
+            f"{agent_type.value}_run_state_{id(self)}", default=None
+        )
 
         self.logger.info(
             "agent_initialized",
@@ -64,6 +107,41 @@ class BaseAgent(ABC, LoggerMixin):
             temperature=temperature,
         )
 
+    @staticmethod
+    def _cached_system_message(prompt: str) -> SystemMessage:
+        """
+        Wrap a static system prompt as a SystemMessage marked for Anthropic prompt caching
+
+        The cache_control breakpoint lets the API reuse the prompt prefix across
+        requests instead of re-processing it every call.
+        """
+        return SystemMessage(content=[{
+            "type": "text",
+            "text": prompt,
+            "cache_control": {"type": "ephemeral"},
+        }])
+
+    def _state(self) -> _RunState:
+        """Get the run state for the current execution context"""
+        state = self._run_state.get()
+        if state is None:
+            state = _RunState()
+            self._run_state.set(state)
+        return state
+
+    @property
+    def tools_used(self) -> list[str]:
+        return self._state().tools_used
+
+    @property
+    def reasoning_steps(self) -> list[str]:
+        return self._state().reasoning_steps
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Release the LLM connection pool shared by all agents (application shutdown)"""
+        await aclose_clients()
+
     @abstractmethod
     def get_system_prompt(self) -> str:
         """Return the system prompt for this agent"""
@@ -82,12 +160,17 @@ class BaseAgent(ABC, LoggerMixin):
     async def _invoke_llm(
         self,
         messages: list[BaseMessage],
+        response_schema: Optional[type[BaseModel]] = None,
         **kwargs: Any
     ) -> Any:
         """
         Invoke LLM with error handling and logging
+
+        With response_schema the model has to answer through a tool call matching
+        the schema, and the validated schema instance is returned instead of the
+        message (None if the tool input didn't validate).
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             self.logger.info(
@@ -96,9 +179,23 @@ class BaseAgent(ABC, LoggerMixin):
                 message_count=len(messages),
             )
 
-            response = await self.llm.ainvoke(messages, **kwargs)
+            response = await anthropic_breaker.call(
+                self._ainvoke_with_retry, messages, response_schema, **kwargs
+            )
+
+            parsed = None
+            if response_schema is not None:
+                # include_raw output: {"raw": AIMessage, "parsed": ..., "parsing_error": ...}
+                parsed = response["parsed"]
+                if parsed is None:
+                    self.logger.warning(
+                        "llm_structured_output_invalid",
+                        schema=response_schema.__name__,
+                        error=str(response.get("parsing_error")),
+                    )
+                response = response["raw"]
 
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             # Log inference metrics
             ai_logger.log_inference(
@@ -109,10 +206,13 @@ class BaseAgent(ABC, LoggerMixin):
                 success=True,
             )
 
+            if response_schema is not None:
+                return parsed
+
             return response
 
         except Exception as e:
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             self.logger.error(
                 "llm_invoke_error",
@@ -131,6 +231,166 @@ class BaseAgent(ABC, LoggerMixin):
 
             raise
 
+    async def _invoke_llm_stream(
+        self,
+        messages: list[BaseMessage],
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream LLM output as text chunks, with the same logging as _invoke_llm
+
+        Not retried or cached - partial output can't be replayed cleanly.
+        """
+        start_ns = time.perf_counter_ns()
+        input_tokens = output_tokens = 0
+
+        self.logger.info(
+            "llm_stream_start",
+            model=self.model,
+            message_count=len(messages),
+        )
+
+        try:
+            async for chunk in self.llm.astream(messages, **kwargs):
+                usage = getattr(chunk, "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+
+                if isinstance(chunk.content, str):
+                    text = chunk.content
+                else:
+                    text = "".join(
+                        block.get("text", "") for block in chunk.content if isinstance(block, dict)
+                    )
+
+                if text:
+                    yield text
+
+        except Exception as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+            self.logger.error(
+                "llm_stream_error",
+                error=str(e),
+                duration_ms=duration_ms,
+            )
+
+            ai_logger.log_inference(
+                model=self.model,
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                duration_ms=duration_ms,
+                success=False,
+                error=str(e),
+            )
+
+            raise
+
+        ai_logger.log_inference(
+            model=self.model,
+            prompt_tokens=input_tokens,
+            completion_tokens=output_tokens,
+            duration_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+            success=True,
+        )
+
+    async def _invoke_llm_sections(
+        self,
+        messages: list[BaseMessage],
+        section_re: re.Pattern[str],
+        on_partial: PartialCallback,
+        **kwargs: Any
+    ) -> str:
+        """
+        Stream the LLM response, reporting each section as soon as it is complete
+
+        A section is complete once the next header matching section_re arrives
+        (the last one when the stream ends). section_re's first group is the
+        section name.
+
+        Returns:
+            Full response text
+        """
+        text = ""
+        headers: list[re.Match[str]] = []
+        emitted = 0
+
+        async for piece in self._invoke_llm_stream(messages, **kwargs):
+            text += piece
+
+            # Rescan from the last known header - a header split across chunks
+            # only matches once it has fully arrived
+            headers.extend(section_re.finditer(text, headers[-1].end() if headers else 0))
+
+            while emitted < len(headers) - 1:
+                await self._emit_section(
+                    on_partial,
+                    headers[emitted],
+                    text[headers[emitted].end():headers[emitted + 1].start()]
+                )
+                emitted += 1
+
+        if emitted < len(headers):
+            await self._emit_section(on_partial, headers[emitted], text[headers[emitted].end():])
+
+        return text
+
+    async def _emit_section(
+        self,
+        on_partial: PartialCallback,
+        header: re.Match[str],
+        body: str
+    ) -> None:
+        """Report one streamed section to the caller's callback"""
+        section = header.group(1).strip().lower().replace(" ", "_")
+        self.add_reasoning_step(f"Streamed section: {section}")
+
+        result = on_partial({
+            "agent_type": self.agent_type.value,
+            "section": section,
+            "content": body.strip(),
+        })
+        if inspect.isawaitable(result):
+            await result
+
+    async def _ainvoke_with_retry(
+        self,
+        messages: list[BaseMessage],
+        response_schema: Optional[type[BaseModel]] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Call the LLM, retrying transient errors with jittered exponential backoff"""
+        llm = self.llm if response_schema is None else self._structured_llm(response_schema)
+
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(RETRYABLE_LLM_ERRORS),
+            wait=wait_exponential_jitter(initial=1, max=20),
+            stop=stop_after_attempt(4),
+            before_sleep=lambda state: self.logger.warning(
+                "llm_invoke_retry",
+                attempt=state.attempt_number,
+                error=str(state.outcome.exception()),
+            ),
+            reraise=True,
+        ):
+            with attempt:
+                response = await llm.ainvoke(messages, **kwargs)
+
+        return response
+
+    def _structured_llm(self, schema: type[BaseModel]) -> Any:
+        """
+        LLM runnable that answers with a forced tool call matching schema
+
+        Returns the raw message alongside the parsed instance so usage metadata
+        can still be logged.
+        """
+        llm = self._structured_llms.get(schema)
+        if llm is None:
+            llm = self.llm.with_structured_output(schema, include_raw=True)
+            self._structured_llms[schema] = llm
+        return llm
+
     def _create_prompt_template(
         self,
         system_prompt: str,
@@ -174,11 +434,12 @@ class BaseAgent(ABC, LoggerMixin):
     ) -> Any:
         """
         Get structured output from Claude using Pydantic models
+
+        Returns an output_schema instance, or None if the model's answer didn't validate.
         """
         self.add_reasoning_step(f"Analyzing with structured output: {output_schema.__name__}")
 
         try:
-            # Use Anthropic's structured output
             messages = [
                 SystemMessage(content=self.get_system_prompt()),
                 HumanMessage(content=prompt)
@@ -187,12 +448,8 @@ class BaseAgent(ABC, LoggerMixin):
             if context:
                 messages.insert(1, HumanMessage(content=f"Context: {context}"))
 
-            response = await self._invoke_llm(messages)
-
-            # Parse to Pydantic model
-            # Note: For true structured output, you'd use Anthropic's JSON mode
-            # This is a simplified version
-            return response
+            # Forced tool call - the API returns the schema's fields, not prose
+            return await self._invoke_llm(messages, response_schema=output_schema)
 
         except Exception as e:
             self.logger.error(
@@ -214,8 +471,52 @@ class BaseAgent(ABC, LoggerMixin):
 
     def reset_state(self) -> None:
         """Reset agent state between executions"""
-        self.tools_used = []
-        self.reasoning_steps = []
+        self._run_state.set(_RunState())
+
+    async def execute_many(
+        self,
+        contexts: list[dict[str, Any]],
+        instruction: str = "",
+        max_concurrency: int = 10,
+        **kwargs: Any
+    ) -> list[AgentResult]:
+        """
+        Run execute() over many contexts concurrently
+
+        Results are returned in the same order as contexts. At most
+        max_concurrency LLM round-trips are in flight at once.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(context: dict[str, Any]) -> AgentResult:
+            async with semaphore:
+                return await self.execute(instruction, context, **kwargs)
+
+        raw_results = await asyncio.gather(
+            *(run(context) for context in contexts),
+            return_exceptions=True
+        )
+
+        results = []
+        for context, result in zip(contexts, raw_results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "execute_many_task_error",
+                    agent_type=self.agent_type.value,
+                    error=str(result),
+                )
+                result = AgentResult(
+                    task_id=context.get("task_id", ""),
+                    agent_type=self.agent_type,
+                    success=False,
+                    result=None,
+                    confidence=0.0,
+                    execution_time_ms=0.0,
+                    error=str(result),
+                )
+            results.append(result)
+
+        return results
 
 
 class AgentOrchestrator(LoggerMixin):
@@ -226,7 +527,8 @@ class AgentOrchestrator(LoggerMixin):
 
     def __init__(self):
         self.agents: dict[AgentType, BaseAgent] = {}
-        self.execution_history: list[dict[str, Any]] = []
+        # Bounded so long-lived orchestrators don't grow without limit
+        self.execution_history: deque[dict[str, Any]] = deque(maxlen=settings.agent_history_size)
 
     def register_agent(self, agent: BaseAgent) -> None:
         """Register an agent with the orchestrator"""
@@ -253,15 +555,25 @@ class AgentOrchestrator(LoggerMixin):
             instruction_length=len(instruction),
         )
 
+        start_ns = time.perf_counter_ns()
+
         try:
             result = await agent.execute(instruction, context, **kwargs)
 
-            self.execution_history.append({
+            entry = {
                 "agent_type": agent_type.value,
-                "instruction": instruction,
-                "result": result.dict(),
+                "task_id": result.task_id,
+                "success": result.success,
+                "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6,
                 "timestamp": datetime.utcnow().isoformat(),
-            })
+            }
+
+            # Full instruction/result payloads only when debugging
+            if settings.debug:
+                entry["instruction"] = instruction
+                entry["result"] = result.dict()
+
+            self.execution_history.append(entry)
 
             return result
 
@@ -282,11 +594,23 @@ class AgentOrchestrator(LoggerMixin):
         Execute multiple agent tasks in sequence or parallel
         """
         if parallel:
-            import asyncio
-            return await asyncio.gather(*[
+            # Let every task finish even if a sibling fails, and keep the successes
+            raw_results = await asyncio.gather(*[
                 self.execute_task(agent_type, instruction, context)
                 for agent_type, instruction, context in tasks
-            ])
+            ], return_exceptions=True)
+
+            results = []
+            for (agent_type, _, _), result in zip(tasks, raw_results):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "workflow_task_error",
+                        agent_type=agent_type.value,
+                        error=str(result),
+                    )
+                else:
+                    results.append(result)
+            return results
         else:
             results = []
             for agent_type, instruction, context in tasks:
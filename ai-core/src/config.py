@@ -2,7 +2,7 @@
 VectorOS AI Core Configuration
 Enterprise-grade configuration management with validation
 """
-import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic import Field, field_validator
@@ -11,6 +11,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # Get the .env file path relative to this config file
 ENV_FILE = Path(__file__).parent.parent.parent / ".env"
 
+_ALLOWED_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+_ALLOWED_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_ALLOWED_ASGI_SERVERS = frozenset({"uvicorn", "granian"})
+
 
 class Settings(BaseSettings):
     """Application settings with validation and type safety"""
@@ -19,7 +23,8 @@ class Settings(BaseSettings):
         env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True  # Read-only after startup, so derived values can be cached
     )
 
     # Application
@@ -31,6 +36,8 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = Field(default=8000, alias="AI_CORE_PORT")
+    workers: int = Field(default=0, ge=0)  # `python -m src.main` processes outside development (0 = CPU count)
+    asgi_server: str = "uvicorn"  # uvicorn or granian (Rust/tokio transport, Linux only)
 
     # AI Configuration
     anthropic_api_key: str = Field(..., min_length=1)
@@ -38,6 +45,9 @@ class Settings(BaseSettings):
     ai_temperature: float = 0.7
     ai_max_tokens: int = 4096
     ai_timeout: int = 120
+    anthropic_max_parallel: int = Field(default=8, ge=1)  # Concurrent Claude calls per generator
+    agent_history_size: int = 1024  # Orchestrator execution history entries kept
+    scoring_pool_workers: int = Field(default=2, ge=0)  # Large-workspace scoring processes per web worker (0 = off)
 
     # Database
     database_url: str = Field(..., min_length=1)
@@ -63,16 +73,20 @@ class Settings(BaseSettings):
         default="http://localhost:3000,http://localhost:3001"
     )
 
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Get CORS origins as a list"""
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Get CORS origins (parsed once)"""
         if isinstance(self.cors_origins, str):
-            return [origin.strip() for origin in self.cors_origins.split(",")]
-        return self.cors_origins
+            return tuple(origin.strip() for origin in self.cors_origins.split(","))
+        return tuple(self.cors_origins)
+
+    # Features
+    enable_intelligent_insights: bool = True  # RAG insights (loads Qdrant + embedding model)
 
     # Monitoring
     enable_metrics: bool = True
     enable_tracing: bool = True
+    enable_server_timing: bool = True  # Server-Timing response header with handler time
 
     # LangChain/LangSmith
     langchain_tracing: bool = Field(default=False, alias="LANGCHAIN_TRACING_V2")
@@ -82,28 +96,40 @@ class Settings(BaseSettings):
     @field_validator("environment")
     @classmethod
     def validate_environment(cls, v: str) -> str:
-        allowed = ["development", "staging", "production"]
-        if v not in allowed:
-            raise ValueError(f"Environment must be one of {allowed}")
+        if v not in _ALLOWED_ENVIRONMENTS:
+            raise ValueError(f"Environment must be one of {sorted(_ALLOWED_ENVIRONMENTS)}")
         return v
 
+    @field_validator("asgi_server")
+    @classmethod
+    def validate_asgi_server(cls, v: str) -> str:
+        v_lower = v.lower()
+        if v_lower not in _ALLOWED_ASGI_SERVERS:
+            raise ValueError(f"ASGI server must be one of {sorted(_ALLOWED_ASGI_SERVERS)}")
+        return v_lower
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in allowed:
-            raise ValueError(f"Log level must be one of {allowed}")
+        if v_upper not in _ALLOWED_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {sorted(_ALLOWED_LOG_LEVELS)}")
         return v_upper
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.environment == "production"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         return self.environment == "development"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the settings singleton (env file parsed and validated once per process)"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
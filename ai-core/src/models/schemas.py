@@ -3,8 +3,8 @@ Pydantic models for type-safe data validation
 Enterprise-grade schemas with comprehensive validation
 """
 from datetime import datetime
-from enum import Enum
-from typing import Any, Optional
+from enum import Enum, IntEnum
+from typing import Any, Literal, Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
@@ -22,6 +22,21 @@ class DealStage(str, Enum):
     LOST = "lost"
 
 
+class StageCode(IntEnum):
+    """Integer codes for DealStage, used to index arrays in vectorized metrics"""
+    LEAD = 0
+    QUALIFIED = 1
+    PROPOSAL = 2
+    NEGOTIATION = 3
+    WON = 4
+    LOST = 5
+    UNKNOWN = 6  # Any stage string not in DealStage
+
+
+# Stage string -> code (unrecognised stages map to StageCode.UNKNOWN)
+STAGE_CODES: dict[str, StageCode] = {stage.value: StageCode[stage.name] for stage in DealStage}
+
+
 class Priority(str, Enum):
     """Priority levels"""
     LOW = "low"
@@ -131,6 +146,15 @@ class ForecastRequest(BaseModel):
     include_scenarios: bool = True  # Best/worst/likely scenarios
 
 
+class RevenueForecastRequest(BaseModel):
+    """Request for a workspace revenue forecast"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    workspace_id: str = Field(..., min_length=1)
+    timeframe: Literal["30d", "60d", "90d"] = "30d"
+    scenario: Literal["best", "likely", "worst"] = "likely"
+
+
 # ============================================================================
 # Response Models
 # ============================================================================
@@ -222,6 +246,27 @@ class ForecastResponse(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class HealthResponse(BaseModel):
+    """Liveness probe response"""
+    model_config = ConfigDict(frozen=True)
+
+    status: str
+    service: str
+    version: str
+    environment: str
+    model: str
+    timestamp: float
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response"""
+    model_config = ConfigDict(frozen=True)
+
+    status: str
+    services_initialized: int = Field(ge=0)
+    services: list[str]
+
+
 # ============================================================================
 # Agent Models
 # ============================================================================
@@ -249,6 +294,35 @@ class AgentResult(BaseModel):
     error: Optional[str] = None
 
 
+# Structured LLM outputs - requested via tool use instead of parsing free text
+
+class DealAnalysisOutput(BaseModel):
+    """Qualitative deal analysis returned by the deal intelligence LLM call"""
+    strengths: list[str] = Field(..., description="Top 3 strengths, each with supporting evidence")
+    risks: list[str] = Field(..., description="Top 3 risks, each with its impact")
+    recommended_actions: list[str] = Field(..., description="3-5 prioritized actions with expected impact")
+    next_best_action: str = Field(..., description="Single most important action to take now")
+
+
+class AnalysisInsight(BaseModel):
+    """Insight as produced by the strategic analysis LLM call"""
+    type: InsightType
+    title: str = Field(..., min_length=1, max_length=200)
+    description: str = Field(..., min_length=1, max_length=2000)
+    priority: Priority
+    confidence: float = Field(..., ge=0.0, le=1.0)
+    impact_score: Optional[float] = Field(None, ge=0.0, le=100.0)
+
+
+class StrategicAnalysisOutput(BaseModel):
+    """Strategic analysis returned by the strategic analyst LLM call"""
+    executive_summary: str = Field(..., description="2-3 sentence overview of key findings")
+    insights: list[AnalysisInsight] = Field(..., description="3-5 insights, most important first")
+    recommendations: list[Recommendation] = Field(..., description="3-5 actionable recommendations")
+    risk_factors: list[str] = Field(default_factory=list, description="Top 3 risks to watch")
+    opportunities: list[str] = Field(default_factory=list, description="Top 3 growth opportunities")
+
+
 # ============================================================================
 # Analytics Models
 # ============================================================================
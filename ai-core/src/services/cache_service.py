@@ -5,11 +5,11 @@ Caches expensive operations like vector searches and AI analyses.
 This is Week 3 of building the AI brain - making it fast and scalable.
 """
 
+import asyncio
 import logging
 import json
 import hashlib
-from typing import Any, Optional, Callable
-from datetime import timedelta
+from typing import Any, Dict, List, Optional, Callable
 from functools import wraps
 
 import redis
@@ -28,6 +28,9 @@ class CacheService:
     3. Implements TTL-based expiration
     4. Provides cache invalidation strategies
     5. Handles cache misses gracefully
+
+    The Redis client is synchronous; every round-trip runs in a worker thread
+    (asyncio.to_thread) so the event loop never waits on the network.
     """
 
     def __init__(self, redis_url: Optional[str] = None):
@@ -98,7 +101,7 @@ class CacheService:
             return None
 
         try:
-            value = self.client.get(key)
+            value = await asyncio.to_thread(self.client.get, key)
             if value:
                 logger.debug(f"Cache hit: {key}")
                 return json.loads(value)
@@ -110,6 +113,27 @@ class CacheService:
             logger.error(f"Cache get error: {e}")
             return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values in one round-trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order (None for misses)
+        """
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+
+        try:
+            values = await asyncio.to_thread(self.client.mget, keys)
+            return [json.loads(value) if value else None for value in values]
+
+        except Exception as e:
+            logger.error(f"Cache mget error: {e}")
+            return [None] * len(keys)
+
     async def set(
         self,
         key: str,
@@ -134,9 +158,9 @@ class CacheService:
             serialized = json.dumps(value)
 
             if ttl:
-                self.client.setex(key, ttl, serialized)
+                await asyncio.to_thread(self.client.setex, key, ttl, serialized)
             else:
-                self.client.set(key, serialized)
+                await asyncio.to_thread(self.client.set, key, serialized)
 
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
@@ -145,6 +169,101 @@ class CacheService:
             logger.error(f"Cache set error: {e}")
             return False
 
+    async def set_if_absent(
+        self,
+        key: str,
+        value: Any,
+        ttl: int
+    ) -> Optional[bool]:
+        """
+        Atomically set a value only if the key does not exist (SET NX EX).
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON serializable)
+            ttl: Time to live in seconds
+
+        Returns:
+            True if the key was set, False if it already existed,
+            None if the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            was_set = await asyncio.to_thread(
+                self.client.set, key, json.dumps(value), nx=True, ex=ttl
+            )
+            logger.debug(f"Cache set-if-absent: {key} ({'set' if was_set else 'exists'})")
+            return bool(was_set)
+
+        except Exception as e:
+            logger.error(f"Cache set-if-absent error: {e}")
+            return None
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> bool:
+        """
+        Set several values with the same TTL in one pipelined round-trip.
+
+        Args:
+            items: Mapping of cache key to value (must be JSON serializable)
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not items:
+            return False
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, json.dumps(value))
+            await asyncio.to_thread(pipe.execute)
+
+            logger.debug(f"Cache set: {len(items)} keys (TTL: {ttl}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+            return False
+
+    async def set_many_if_absent(
+        self,
+        keys: List[str],
+        value: Any,
+        ttl: int
+    ) -> Optional[List[bool]]:
+        """
+        Pipelined SET NX EX over several keys.
+
+        Args:
+            keys: Cache keys
+            value: Value stored under each key (must be JSON serializable)
+            ttl: Time to live in seconds
+
+        Returns:
+            Per-key True if set / False if it already existed,
+            None if the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+
+        if not keys:
+            return []
+
+        try:
+            serialized = json.dumps(value)
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(key, serialized, nx=True, ex=ttl)
+
+            return [bool(was_set) for was_set in await asyncio.to_thread(pipe.execute)]
+
+        except Exception as e:
+            logger.error(f"Cache set_many_if_absent error: {e}")
+            return None
+
     async def delete(self, key: str) -> bool:
         """
         Delete value from cache.
@@ -159,7 +278,7 @@ class CacheService:
             return False
 
         try:
-            deleted = self.client.delete(key)
+            deleted = await asyncio.to_thread(self.client.delete, key)
             logger.debug(f"Cache delete: {key}")
             return bool(deleted)
 
@@ -181,9 +300,9 @@ class CacheService:
             return 0
 
         try:
-            keys = self.client.keys(pattern)
+            keys = await asyncio.to_thread(self.client.keys, pattern)
             if keys:
-                deleted = self.client.delete(*keys)
+                deleted = await asyncio.to_thread(self.client.delete, *keys)
                 logger.info(f"Cache invalidated: {deleted} keys matching {pattern}")
                 return deleted
             return 0
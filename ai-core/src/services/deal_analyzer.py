@@ -4,14 +4,15 @@ LLM-powered deep analysis with structured insights, predictions, and recommendat
 NOW WITH MEMORY & LEARNING: Uses vector search to find similar deals and tracks prediction accuracy
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import asyncio
+from typing import AsyncIterator, Dict, List, Any, Optional
+from datetime import datetime
 import json
 import logging
-from anthropic import Anthropic
+import httpx
+from anthropic import AsyncAnthropic
 from ..config import settings
-from .memory_service import get_memory_service
-from .outcome_tracker import get_outcome_tracker
+from .llm_cache import get_llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +22,33 @@ class DealAnalyzer:
     Provides deep insights, win probability predictions, risk assessment, and recommendations
     """
 
-    def __init__(self, db_client=None):
-        """Initialize the analyzer with Claude API, memory service, and outcome tracking"""
+    ANALYSIS_MAX_TOKENS = 2000
+    ANALYSIS_TEMPERATURE = 0.3
+
+    def __init__(self, db_client=None, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the analyzer with Claude API, memory service, and outcome tracking
+
+        Args:
+            db_client: Database client for outcome tracking
+            http_client: Shared async HTTP pool for Claude calls (one per client if omitted)
+        """
         api_key = settings.anthropic_api_key
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-        self.client = Anthropic(api_key=api_key)
+        # Async client so Claude calls never block the event loop
+        self.async_client = AsyncAnthropic(api_key=api_key, http_client=http_client)
         # Using Claude Sonnet 4.5 - latest and best model as of 2025
         self.model = "claude-sonnet-4-5-20250929"
 
+        # Exact-match cache so re-analysing an unchanged deal skips Claude
+        self.llm_cache = get_llm_cache()
+
         # Initialize memory service for semantic search and learning
+        # (imported here: it pulls in qdrant and sentence-transformers)
         try:
+            from .memory_service import get_memory_service
             self.memory_service = get_memory_service()
             logger.info("Memory service initialized in deal analyzer")
         except Exception as e:
@@ -42,6 +58,7 @@ class DealAnalyzer:
         # Initialize outcome tracker for learning from predictions
         if db_client:
             try:
+                from .outcome_tracker import get_outcome_tracker
                 self.outcome_tracker = get_outcome_tracker(db_client)
                 logger.info("Outcome tracker initialized in deal analyzer")
             except Exception as e:
@@ -92,11 +109,29 @@ class DealAnalyzer:
             except Exception as e:
                 logger.error(f"Memory service error: {e}")
 
-        # Build context about the deal and workspace
-        context = self._build_analysis_context(deal, workspace_deals or [], similar_deals)
+        # Build context about the deal and workspace (O(N) over the workspace, so
+        # run it in a worker thread rather than on the event loop)
+        context = await asyncio.to_thread(
+            self._build_analysis_context, deal, workspace_deals or [], similar_deals
+        )
 
-        # Generate AI analysis using Claude
-        analysis = self._generate_llm_analysis(deal, context)
+        # Generate AI analysis using Claude (reusing the result for an identical prompt)
+        prompt = self._build_analysis_prompt(deal, context)
+        cache_key = self.llm_cache.make_key(
+            model=self.model,
+            max_tokens=self.ANALYSIS_MAX_TOKENS,
+            temperature=self.ANALYSIS_TEMPERATURE,
+            prompt=prompt,
+        )
+        analysis = await self.llm_cache.get(cache_key)
+        if analysis is None:
+            try:
+                analysis = await self._generate_llm_analysis(prompt)
+            except Exception as e:
+                # Fallback to structured empty response if AI fails (not cached)
+                analysis = self._get_fallback_analysis(str(e))
+            else:
+                await self.llm_cache.set(cache_key, analysis)
 
         # Record predictions for learning (if outcome tracker available)
         prediction_ids = []
@@ -139,6 +174,58 @@ class DealAnalyzer:
             }
         }
 
+    async def stream_analysis(
+        self,
+        deal: Dict[str, Any],
+        workspace_id: str,
+        workspace_deals: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the Claude analysis of a deal as it is generated
+
+        Uses the same memory-enhanced prompt as analyze_deal, but yields the raw
+        JSON text in chunks instead of waiting for the full response. Nothing
+        is stored in memory or recorded as a prediction.
+
+        Args:
+            deal: The deal to analyze
+            workspace_id: Workspace identifier
+            workspace_deals: Other deals in workspace for context
+
+        Yields:
+            Text chunks of the analysis JSON
+        """
+        similar_deals = []
+        if self.memory_service:
+            try:
+                similar_deals = await self.memory_service.find_similar_deals(
+                    deal=deal,
+                    workspace_id=workspace_id,
+                    top_k=5,
+                    min_score=0.7
+                )
+            except Exception as e:
+                logger.error(f"Memory service error: {e}")
+
+        context = await asyncio.to_thread(
+            self._build_analysis_context, deal, workspace_deals or [], similar_deals
+        )
+        prompt = self._build_analysis_prompt(deal, context)
+
+        async with self.async_client.messages.stream(
+            model=self.model,
+            max_tokens=2000,
+            temperature=0.3,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
     def _build_analysis_context(
         self,
         deal: Dict[str, Any],
@@ -207,39 +294,23 @@ class DealAnalyzer:
         position = sum(1 for v in sorted_values if v <= value)
         return (position / len(sorted_values)) * 100
 
-    def _generate_llm_analysis(
-        self,
-        deal: Dict[str, Any],
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate structured analysis using Claude"""
-
-        # Build the analysis prompt
-        prompt = self._build_analysis_prompt(deal, context)
-
-        # Call Claude API
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.3,  # Lower temperature for more consistent analysis
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # Parse the JSON response
-            analysis_text = response.content[0].text
-            analysis = json.loads(analysis_text)
-
-            return analysis
+    async def _generate_llm_analysis(self, prompt: str) -> Dict[str, Any]:
+        """Generate structured analysis using Claude (raises if the call or parsing fails)"""
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=self.ANALYSIS_MAX_TOKENS,
+            temperature=self.ANALYSIS_TEMPERATURE,  # Lower temperature for more consistent analysis
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
 
-        except Exception as e:
-            # Fallback to structured empty response if AI fails
-            return self._get_fallback_analysis(str(e))
+        # Parse the JSON response
+        analysis_text = response.content[0].text
+        return json.loads(analysis_text)
 
     def _build_analysis_prompt(
         self,
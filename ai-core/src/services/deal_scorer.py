@@ -10,21 +10,48 @@ Calculates automated health scores for deals based on:
 - Data completeness
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, Optional
-import json
+
+import numpy as np
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Workspaces smaller than this are scored in one batch in-process; pickling the
+# deals to pool workers costs more than it saves below a few thousand deals
+PARALLEL_SCORING_MIN_DEALS = 2000
+
+# Threshold ladders of the _score_* methods, as (bin edges, score per bin) for
+# np.digitize in score_workspace_vectorized - keep in sync with those methods
+_VELOCITY_BINS = (np.array([7, 14, 30, 60]), np.array([100, 80, 60, 40, 20]))
+_FRESHNESS_BINS = (np.array([30, 60, 90, 180]), np.array([100, 90, 70, 50, 30]))
+_URGENCY_BINS = (np.array([0, 7, 30, 60, 90]), np.array([30, 100, 90, 70, 50, 40]))
+_VALUE_RATIO_BINS = (np.array([0.5, 0.8, 1.5, 2.0]), np.array([30, 50, 70, 90, 100]))
+_HEALTH_STATUS_BINS = (
+    np.array([20, 40, 60, 80]),
+    ('critical', 'poor', 'fair', 'good', 'excellent'),
+)
+
 
 class DealScorer:
     """
     Automated deal health scoring system
     """
 
-    def __init__(self):
+    def __init__(self, pool_workers: int = 0):
+        """
+        Args:
+            pool_workers: Processes for scoring very large workspaces (0 = no pool).
+                The pool is only started the first time a workspace needs it.
+        """
+        self.pool_workers = pool_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
         self.weights = {
             'probability': 0.25,      # Win probability (0-100)
             'velocity': 0.20,         # Speed through pipeline
@@ -34,13 +61,47 @@ class DealScorer:
             'value_score': 0.10,      # Relative deal size
         }
 
-    def score_deal(self, deal: Dict[str, Any], workspace_deals: Optional[list] = None) -> Dict[str, Any]:
+    def precompute_workspace_stats(self, workspace_deals: Optional[list]) -> Optional[Dict[str, Any]]:
+        """
+        Compute the workspace aggregates used for relative scoring, once
+
+        Pass the result to score_deal(ws_stats=...) when scoring many deals
+        from the same workspace instead of re-reducing workspace_deals per deal.
+
+        Args:
+            workspace_deals: List of all deals in workspace
+
+        Returns:
+            Dict with deal_count and avg_value, or None without workspace data
+        """
+        if not workspace_deals:
+            return None
+
+        values = np.fromiter(
+            (d.get('value', 0) or 0 for d in workspace_deals),
+            dtype=np.float64,
+            count=len(workspace_deals),
+        )
+        total_value = float(values.sum())
+
+        return {
+            'deal_count': len(workspace_deals),
+            'avg_value': total_value / len(workspace_deals) if total_value > 0 else 0,
+        }
+
+    def score_deal(
+        self,
+        deal: Dict[str, Any],
+        workspace_deals: Optional[list] = None,
+        ws_stats: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Calculate comprehensive health score for a deal
 
         Args:
             deal: Deal dictionary with all deal data
             workspace_deals: List of all deals in workspace (for relative scoring)
+            ws_stats: Precomputed precompute_workspace_stats(workspace_deals) (takes precedence)
 
         Returns:
             Dict with health_score (0-100), health_status, and breakdown
@@ -54,7 +115,9 @@ class DealScorer:
             freshness_score = self._score_freshness(deal)
             completeness_score = self._score_completeness(deal)
             urgency_score = self._score_urgency(deal)
-            value_score = self._score_value(deal, workspace_deals)
+            if ws_stats is None:
+                ws_stats = self.precompute_workspace_stats(workspace_deals)
+            value_score = self._score_value(deal, ws_stats)
 
             # Calculate weighted health score
             health_score = (
@@ -98,6 +161,25 @@ class DealScorer:
             logger.error(f"Error scoring deal {deal.get('id')}: {str(e)}", exc_info=True)
             raise
 
+    async def ascore_deal(
+        self,
+        deal: Dict[str, Any],
+        workspace_deals: Optional[list] = None,
+        ws_stats: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async score_deal - runs the scoring in a worker thread
+
+        Args:
+            deal: Deal dictionary with all deal data
+            workspace_deals: List of all deals in workspace (for relative scoring)
+            ws_stats: Precomputed precompute_workspace_stats(workspace_deals) (takes precedence)
+
+        Returns:
+            Dict with health_score (0-100), health_status, and breakdown
+        """
+        return await asyncio.to_thread(self.score_deal, deal, workspace_deals, ws_stats)
+
     def _score_probability(self, deal: Dict[str, Any]) -> float:
         """
         Score based on win probability
@@ -272,7 +354,7 @@ class DealScorer:
             logger.warning(f"Error calculating urgency score: {str(e)}")
             return 30
 
-    def _score_value(self, deal: Dict[str, Any], workspace_deals: Optional[list] = None) -> float:
+    def _score_value(self, deal: Dict[str, Any], ws_stats: Optional[Dict[str, Any]] = None) -> float:
         """
         Score based on deal value relative to workspace average
 
@@ -286,12 +368,10 @@ class DealScorer:
         """
         deal_value = deal.get('value', 0) or 0
 
-        if not workspace_deals or len(workspace_deals) == 0:
+        if not ws_stats:
             return 50  # Can't compare without context
 
-        # Calculate average deal value
-        total_value = sum(d.get('value', 0) or 0 for d in workspace_deals)
-        avg_value = total_value / len(workspace_deals) if total_value > 0 else 0
+        avg_value = ws_stats['avg_value']
 
         if avg_value == 0:
             return 50
@@ -372,9 +452,14 @@ class DealScorer:
 
         return insights
 
-    def score_workspace(self, deals: list) -> Dict[str, Any]:
+    def score_workspace_vectorized(self, deals: list) -> Dict[str, Any]:
         """
-        Score all deals in a workspace and return aggregate metrics
+        Score all deals in a workspace in one batch and return aggregate metrics
+
+        Same scores as score_deal for each deal, but each deal is only
+        reduced to a row of numbers (whole days, counts, value) in Python; the
+        threshold ladders, weighting and status bucketing run as NumPy array
+        ops over all deals at once.
 
         Args:
             deals: List of deal dictionaries
@@ -382,31 +467,226 @@ class DealScorer:
         Returns:
             Dict with individual scores and workspace-level metrics
         """
-        logger.info(f"Scoring {len(deals)} deals in workspace")
+        logger.info(f"Scoring {len(deals)} deals in workspace (vectorized)")
 
-        scored_deals = []
+        ws_stats = self.precompute_workspace_stats(deals)
+        avg_value = ws_stats['avg_value'] if ws_stats else 0
+
+        return self._summarize_workspace(deals, self._score_batch(deals, avg_value))
+
+    async def ascore_workspace_pooled(
+        self,
+        deals: list,
+        min_deals: int = PARALLEL_SCORING_MIN_DEALS,
+    ) -> Dict[str, Any]:
+        """
+        Score a workspace across a process pool and return aggregate metrics
+
+        Workspace stats are computed once here; the deals are split into one
+        chunk per pool worker, each chunk is batch-scored in a worker process
+        (see _score_chunk), and the results are summarized in this process.
+        Small workspaces, or a scorer without pool_workers, fall back to
+        score_workspace_vectorized in a worker thread.
+
+        Args:
+            deals: List of deal dictionaries
+            min_deals: Smallest workspace worth fanning out
+
+        Returns:
+            Dict with individual scores and workspace-level metrics
+        """
+        if not self.pool_workers or len(deals) < min_deals:
+            return await asyncio.to_thread(self.score_workspace_vectorized, deals)
+
+        logger.info(f"Scoring {len(deals)} deals in workspace (process pool)")
+
+        ws_stats = self.precompute_workspace_stats(deals)
+        avg_value = ws_stats['avg_value'] if ws_stats else 0
+
+        executor = self._get_pool()
+        chunk_size = -(-len(deals) // self.pool_workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(executor, _score_chunk, deals[i:i + chunk_size], avg_value)
+            for i in range(0, len(deals), chunk_size)
+        ))
+
+        scored_deals = [scored for chunk in chunks for scored in chunk]
+        return self._summarize_workspace(deals, scored_deals)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the scoring process pool on first use"""
+        if self._pool is None:
+            # The server process already runs threads (log queue listener, agent
+            # loop, metrics flusher), so forking it can deadlock the children -
+            # start workers from a clean forkserver (spawn where unavailable)
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pool_workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        return self._pool
+
+    def shutdown_pool(self) -> None:
+        """Stop the scoring process pool, if it was started (application shutdown)"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _score_batch(self, deals: list, avg_value: float) -> list:
+        """
+        Score deals as NumPy array ops against a precomputed workspace average
+
+        Returns the scored deals (deals that fail feature extraction are
+        logged and skipped).
+        """
+        rows = []
+        scorable = []
         for deal in deals:
             try:
-                score = self.score_deal(deal, deals)
-                scored_deals.append({
-                    'deal_id': deal.get('id'),
-                    'title': deal.get('title'),
-                    **score
-                })
+                rows.append(self._deal_features(deal))
+                scorable.append(deal)
             except Exception as e:
                 logger.error(f"Failed to score deal {deal.get('id')}: {str(e)}")
-                continue
 
-        # Calculate workspace metrics
+        if not rows:
+            return []
+
+        # Columns: probability, days idle, days old, days until close,
+        # completeness points, value (NaN = date missing or unparseable)
+        features = np.array(rows, dtype=np.float64)
+        probability, days_idle, days_old, days_until, points, values = features.T
+
+        probability_scores = np.clip(probability, 0, 100)
+        velocity_scores = self._bucket(days_idle, _VELOCITY_BINS, default=50)
+        freshness_scores = self._bucket(days_old, _FRESHNESS_BINS, default=50)
+        urgency_scores = self._bucket(days_until, _URGENCY_BINS, default=30)
+        completeness_scores = np.minimum(100, (points / 130) * 100)
+        if avg_value == 0:
+            value_scores = np.full(len(rows), 50.0)
+        else:
+            value_scores = self._bucket(values / avg_value, _VALUE_RATIO_BINS, default=50)
+
+        # Same term order as score_deal so the floating-point sums match exactly
+        w = self.weights
+        health_scores = (
+            probability_scores * w['probability'] +
+            velocity_scores * w['velocity'] +
+            freshness_scores * w['freshness'] +
+            completeness_scores * w['completeness'] +
+            urgency_scores * w['urgency'] +
+            value_scores * w['value_score']
+        )
+        edges, labels = _HEALTH_STATUS_BINS
+        status_index = np.digitize(health_scores, edges, right=False)
+
+        # Back to Python floats in one tolist() per column instead of a float()
+        # per element, then assemble one dict per deal
+        component_names = (
+            'probability', 'velocity', 'freshness', 'completeness', 'urgency', 'value_score'
+        )
+        component_rows = zip(*np.stack((
+            probability_scores, velocity_scores, freshness_scores,
+            completeness_scores, urgency_scores, value_scores,
+        )).tolist())
+
+        scored_deals = []
+        for deal, row, health_score, status_i in zip(
+            scorable, component_rows, health_scores.tolist(), status_index.tolist()
+        ):
+            components = dict(zip(component_names, row))
+            scored_deals.append({
+                'deal_id': deal.get('id'),
+                'title': deal.get('title'),
+                'health_score': round(health_score, 1),
+                'health_status': labels[status_i],
+                'components': {name: round(score, 1) for name, score in components.items()},
+                'insights': self._generate_insights(deal, components),
+            })
+
+        return scored_deals
+
+    def _deal_features(self, deal: Dict[str, Any]) -> tuple:
+        """
+        Reduce a deal to the numeric row used by score_workspace_vectorized
+
+        Dates become whole days (timedelta.days, as in the _score_* methods),
+        NaN when missing or unparseable.
+        """
+        nan = float('nan')
+
+        probability = float(deal.get('probability', 0) or 0)
+
+        days_idle = nan
+        try:
+            if deal.get('updatedAt'):
+                last_updated = self._parse_deal_date(deal['updatedAt'], '%Y-%m-%d %H:%M:%S')
+                days_idle = (datetime.now(last_updated.tzinfo) - last_updated).days
+        except Exception as e:
+            logger.warning(f"Error calculating velocity score: {str(e)}")
+
+        days_old = nan
+        try:
+            if deal.get('createdAt'):
+                created_date = self._parse_deal_date(deal['createdAt'], '%Y-%m-%d %H:%M:%S')
+                days_old = (datetime.now(created_date.tzinfo) - created_date).days
+        except Exception as e:
+            logger.warning(f"Error calculating freshness score: {str(e)}")
+
+        days_until = nan
+        close_date = deal.get('closeDate')
+        try:
+            if close_date:
+                target_date = self._parse_deal_date(close_date, '%Y-%m-%d')
+                days_until = (target_date - datetime.now(target_date.tzinfo)).days
+        except Exception as e:
+            logger.warning(f"Error calculating urgency score: {str(e)}")
+
+        points = sum(
+            20 for field in ('title', 'value', 'stage', 'probability', 'closeDate')
+            if deal.get(field) is not None and str(deal.get(field)).strip()
+        ) + sum(
+            10 for field in ('company', 'contactName', 'contactEmail')
+            if deal.get(field) is not None and str(deal.get(field)).strip()
+        )
+
+        value = float(deal.get('value', 0) or 0)
+
+        return (probability, days_idle, days_old, days_until, points, value)
+
+    @staticmethod
+    def _parse_deal_date(value: Any, fallback_format: str) -> datetime:
+        """Parse an ISO (or fallback_format) date string; datetimes pass through"""
+        if not isinstance(value, str):
+            return value
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return datetime.strptime(value, fallback_format)
+
+    @staticmethod
+    def _bucket(x: np.ndarray, bins: tuple, default: float) -> np.ndarray:
+        """Map each value to its threshold-ladder score (default where x is NaN)"""
+        edges, scores = bins
+        return np.where(np.isnan(x), default, scores[np.digitize(np.nan_to_num(x), edges)]).astype(np.float64)
+
+    def _summarize_workspace(self, deals: list, scored_deals: list) -> Dict[str, Any]:
+        """
+        Build the workspace response from individual deal scores (single pass)
+        """
         if scored_deals:
-            avg_health = sum(d['health_score'] for d in scored_deals) / len(scored_deals)
-            health_distribution = {
-                'excellent': sum(1 for d in scored_deals if d['health_status'] == 'excellent'),
-                'good': sum(1 for d in scored_deals if d['health_status'] == 'good'),
-                'fair': sum(1 for d in scored_deals if d['health_status'] == 'fair'),
-                'poor': sum(1 for d in scored_deals if d['health_status'] == 'poor'),
-                'critical': sum(1 for d in scored_deals if d['health_status'] == 'critical'),
-            }
+            health_distribution = dict.fromkeys(
+                ('excellent', 'good', 'fair', 'poor', 'critical'), 0
+            )
+            total_health = 0.0
+            for d in scored_deals:
+                total_health += d['health_score']
+                health_distribution[d['health_status']] += 1
+            avg_health = total_health / len(scored_deals)
         else:
             avg_health = 0
             health_distribution = {}
@@ -420,3 +700,20 @@ class DealScorer:
                 'health_distribution': health_distribution,
             }
         }
+
+
+# Per-process scorer used by _score_chunk
+_chunk_scorer: Optional[DealScorer] = None
+
+
+def _score_chunk(deals: list, avg_value: float) -> list:
+    """
+    Batch-score a chunk of a workspace (process pool entry point)
+
+    Top-level so it pickles for ProcessPoolExecutor; DealScorer holds no
+    per-request state, so each worker process builds one instance.
+    """
+    global _chunk_scorer
+    if _chunk_scorer is None:
+        _chunk_scorer = DealScorer()
+    return _chunk_scorer._score_batch(deals, avg_value)
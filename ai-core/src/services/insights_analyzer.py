@@ -9,7 +9,7 @@ Analyzes workspace deals and generates AI-powered insights:
 """
 
 import anthropic
-from datetime import datetime, timedelta
+import asyncio
 from typing import List, Dict, Any
 import json
 
@@ -77,6 +77,18 @@ class InsightsAnalyzer:
             logger.error(f"Error analyzing workspace: {str(e)}", exc_info=True)
             raise
 
+    async def aanalyze_workspace(self, deals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Async analyze_workspace - runs the blocking Claude call in a worker thread
+
+        Args:
+            deals: List of deal dictionaries with all deal data
+
+        Returns:
+            List of insight objects ready to be stored in database
+        """
+        return await asyncio.to_thread(self.analyze_workspace, deals)
+
     def _get_system_prompt(self) -> str:
         """
         System prompt for Claude - defines the AI's role and output format
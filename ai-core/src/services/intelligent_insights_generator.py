@@ -3,16 +3,110 @@ Intelligent Insights Generator - RAG-Based AI System
 Uses Claude Sonnet 4 with vector memory for context-aware deal analysis
 """
 
+import asyncio
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 import logging
 import json
 import os
-from anthropic import Anthropic
+import httpx
+import orjson
+from anthropic import AsyncAnthropic
+
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_json_block(text: str) -> str:
+    """
+    Return the first complete JSON object/array in text
+
+    Single pass from the first '{' or '[': tracks bracket depth (ignoring
+    brackets inside strings) and stops when it returns to zero, so markdown
+    fences and prose around the JSON are skipped. Falls back to the stripped
+    text if no balanced block is found.
+    """
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        return text.strip()
+
+    start = min(starts)
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return text.strip()
+
+
+class InsightStreamScanner:
+    """
+    Pull complete insight objects out of Claude's output while it streams
+
+    Feed text chunks as they arrive; each call returns the objects that were
+    completed by that chunk (elements of the top-level array, or the top-level
+    object itself), so parsing finishes as soon as generation does.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element_depth: Optional[int] = None  # Depth at which insight objects open
+        self._current: List[str] = []
+        self._capturing = False
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume a chunk and return the insight objects it completed"""
+        completed = []
+        for char in text:
+            if self._capturing:
+                self._current.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._element_depth is None:
+                    self._element_depth = 1 if char == "[" else 0
+                if char == "{" and not self._capturing and self._depth == self._element_depth:
+                    self._capturing = True
+                    self._current = ["{"]
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._capturing and self._depth == self._element_depth:
+                    self._capturing = False
+                    try:
+                        completed.append(orjson.loads("".join(self._current)))
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"[Parse] Skipping malformed streamed insight: {str(e)}")
+        return completed
+
+
 class IntelligentInsightsGenerator:
     """
     Production-grade insights generator using RAG (Retrieval-Augmented Generation)
@@ -29,7 +123,8 @@ class IntelligentInsightsGenerator:
         self,
         anthropic_api_key: Optional[str] = None,
         memory_service=None,
-        deal_analyzer=None
+        deal_analyzer=None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize intelligent insights generator
@@ -38,16 +133,34 @@ class IntelligentInsightsGenerator:
             anthropic_api_key: API key for Anthropic Claude
             memory_service: Vector memory service for RAG
             deal_analyzer: Deal scoring service
+            http_client: Shared async HTTP pool for Claude calls (one per client if omitted)
         """
-        self.anthropic = Anthropic(
-            api_key=anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
+        # Async client so Claude calls don't block the event loop
+        self.anthropic = AsyncAnthropic(
+            api_key=anthropic_api_key or os.getenv("ANTHROPIC_API_KEY"),
+            http_client=http_client
         )
         self.memory = memory_service
         self.deal_analyzer = deal_analyzer
 
+        # Caps in-flight Claude calls (across deals and concurrent requests)
+        # to stay within the Anthropic rate limit - ANTHROPIC_MAX_PARALLEL
+        self._claude_slots = asyncio.Semaphore(settings.anthropic_max_parallel)
+
         # System prompt for Claude - defines its role and capabilities
         self.system_prompt = self._build_system_prompt()
 
+        # The system prompt is identical for every call - mark it for Anthropic
+        # prompt caching so repeat calls within the cache TTL re-read the prefix
+        # instead of paying for it again. It must stay free of per-call data.
+        self.system_blocks = [
+            {
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def _build_system_prompt(self) -> str:
         """Build the system prompt that defines Claude's role"""
         return """You are an elite sales intelligence AI, trained on thousands of successful (and failed) enterprise deals.
@@ -162,15 +275,19 @@ Be direct, data-driven, and actionable. No fluff."""
 
             logger.info(f"[IntelligentInsights] Analyzing {len(deals)} deals")
 
-            # Generate insights for each deal using AI
+            # Generate insights for all deals concurrently (Claude calls are
+            # bounded by self._claude_slots)
+            results = await asyncio.gather(
+                *(self._analyze_deal_with_rag(deal, workspace_id) for deal in deals),
+                return_exceptions=True
+            )
+
             all_insights = []
-            for deal in deals:
-                try:
-                    deal_insights = await self._analyze_deal_with_rag(deal, workspace_id)
-                    all_insights.extend(deal_insights)
-                except Exception as e:
-                    logger.error(f"[IntelligentInsights] Error analyzing deal {deal.get('id')}: {str(e)}")
+            for deal, deal_insights in zip(deals, results):
+                if isinstance(deal_insights, Exception):
+                    logger.error(f"[IntelligentInsights] Error analyzing deal {deal.get('id')}: {str(deal_insights)}")
                     continue
+                all_insights.extend(deal_insights)
 
             logger.info(f"[IntelligentInsights] Generated {len(all_insights)} insights")
 
@@ -235,17 +352,18 @@ Be direct, data-driven, and actionable. No fluff."""
             logger.info(f"[Claude] Calling API for deal: {deal.get('title')}")
             logger.info(f"[Claude] Prompt length: {len(prompt)} chars")
 
-            response = self.anthropic.messages.create(
-                model="claude-sonnet-4-20250514",  # Latest Sonnet 4
-                max_tokens=4000,
-                system=self.system_prompt,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            async with self._claude_slots:
+                response = await self.anthropic.messages.create(
+                    model="claude-sonnet-4-20250514",  # Latest Sonnet 4
+                    max_tokens=4000,
+                    system=self.system_blocks,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                )
 
             # Extract response text
             response_text = response.content[0].text
@@ -261,7 +379,7 @@ Be direct, data-driven, and actionable. No fluff."""
             logger.info(f"[Claude] Parsed {len(insights)} insights from response")
             if len(insights) == 0:
                 logger.warning(f"[Claude] ⚠️  WARNING: Claude returned 0 insights!")
-                logger.warning(f"[Claude] Deal data was: {json.dumps(deal, default=str)}")
+                logger.warning(f"[Claude] Deal data was: {orjson.dumps(deal, default=str).decode()}")
 
             return insights
 
@@ -377,6 +495,33 @@ Return ONLY the JSON array, no other text."""
 
         return prompt
 
+    def _validate_insight(
+        self,
+        insight: Dict[str, Any],
+        deal: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fill defaults, clamp values and attach deal context to one parsed insight"""
+        # Ensure required fields
+        validated_insight = {
+            "type": insight.get("type", "recommendation"),
+            "title": insight.get("title", "")[:100],  # Limit length
+            "description": insight.get("description", "")[:300],
+            "priority": insight.get("priority", "medium"),
+            "confidence": min(max(insight.get("confidence", 0.7), 0.0), 1.0),
+            "data": insight.get("data", {}),
+            "actions": insight.get("actions", [])
+        }
+
+        # Ensure data has deal context
+        if "deal_id" not in validated_insight["data"]:
+            validated_insight["data"]["deal_id"] = deal.get("id")
+        if "deal_title" not in validated_insight["data"]:
+            validated_insight["data"]["deal_title"] = deal.get("title")
+        if "deal_value" not in validated_insight["data"]:
+            validated_insight["data"]["deal_value"] = deal.get("value")
+
+        return validated_insight
+
     def _parse_claude_response(
         self,
         response_text: str,
@@ -398,52 +543,20 @@ Return ONLY the JSON array, no other text."""
             List of validated insights
         """
         try:
-            # Try to extract JSON from markdown code blocks
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                json_str = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                json_str = response_text[start:end].strip()
-            else:
-                json_str = response_text.strip()
+            # Extract the JSON (Claude sometimes wraps it in markdown or prose)
+            json_str = _extract_json_block(response_text)
 
             # Parse JSON
-            insights = json.loads(json_str)
+            insights = orjson.loads(json_str)
 
             # Ensure it's a list
             if not isinstance(insights, list):
                 insights = [insights]
 
             # Validate and enrich each insight
-            validated_insights = []
-            for insight in insights:
-                # Ensure required fields
-                validated_insight = {
-                    "type": insight.get("type", "recommendation"),
-                    "title": insight.get("title", "")[:100],  # Limit length
-                    "description": insight.get("description", "")[:300],
-                    "priority": insight.get("priority", "medium"),
-                    "confidence": min(max(insight.get("confidence", 0.7), 0.0), 1.0),
-                    "data": insight.get("data", {}),
-                    "actions": insight.get("actions", [])
-                }
-
-                # Ensure data has deal context
-                if "deal_id" not in validated_insight["data"]:
-                    validated_insight["data"]["deal_id"] = deal.get("id")
-                if "deal_title" not in validated_insight["data"]:
-                    validated_insight["data"]["deal_title"] = deal.get("title")
-                if "deal_value" not in validated_insight["data"]:
-                    validated_insight["data"]["deal_value"] = deal.get("value")
-
-                validated_insights.append(validated_insight)
-
-            return validated_insights
+            return [self._validate_insight(insight, deal) for insight in insights]
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"[Parse] Failed to parse Claude response as JSON: {str(e)}")
             logger.error(f"[Parse] Response was: {response_text}")
             return []
@@ -0,0 +1,126 @@
+"""
+LLM Cache - Exact-match reuse of LLM results
+Keys results by a 128-bit xxHash of everything that determines the model's input
+(model, prompt, sampling parameters), so a byte-identical request is answered
+without another Claude call.
+
+It never returns an answer to a different prompt, so it is safe for any
+call whose input fully determines the result we want to show.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import orjson
+import xxhash
+
+from .cache_service import CacheService, get_cache_service
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    Two-tier exact-match cache for LLM results.
+
+    This service:
+    1. Derives deterministic keys from the canonical JSON of the call inputs
+    2. Keeps recent results in a bounded in-process LRU (no network hop)
+    3. Falls back to Redis (via CacheService) so results are shared by workers
+    4. Expires entries after a TTL in both tiers
+    """
+
+    NAMESPACE = "llm"
+
+    def __init__(
+        self,
+        cache_service: Optional[CacheService] = None,
+        maxsize: int = 10_000,
+        ttl: int = 3600,
+    ):
+        """
+        Initialize LLM cache.
+
+        Args:
+            cache_service: Redis-backed cache shared across workers (optional)
+            maxsize: Maximum number of entries kept in process
+            ttl: Default time to live in seconds
+        """
+        self.cache_service = cache_service
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._local: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+
+    def make_key(self, **inputs: Any) -> str:
+        """
+        Build a cache key from the inputs of an LLM call.
+
+        Args:
+            **inputs: Everything that determines the call (model, prompt, temperature, ...)
+
+        Returns:
+            Cache key
+        """
+        # Non-cryptographic hash: keys only need to be collision-resistant,
+        # and xxh3 over orjson output is far cheaper than sha256 over json.dumps
+        canonical = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS, default=str)
+        return f"vectoros:{self.NAMESPACE}:{xxhash.xxh3_128_hexdigest(canonical)}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached result or None on miss
+        """
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                logger.debug(f"LLM cache hit (local): {key}")
+                return value
+            del self._local[key]
+
+        if self.cache_service is not None and self.cache_service.enabled:
+            value = await self.cache_service.get(key)
+            if value is not None:
+                logger.debug(f"LLM cache hit (redis): {key}")
+                self._set_local(key, value, self.ttl)
+                return value
+
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable result
+            ttl: Time to live in seconds (defaults to the cache TTL)
+        """
+        ttl = ttl or self.ttl
+        self._set_local(key, value, ttl)
+
+        if self.cache_service is not None and self.cache_service.enabled:
+            await self.cache_service.set(key, value, ttl)
+
+    def _set_local(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Insert into the in-process LRU, evicting the least recently used entry if full."""
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        if len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM cache (backed by the shared Redis cache service)."""
+    return LLMCache(cache_service=get_cache_service())
@@ -5,10 +5,11 @@ Enables VectorOS to remember past deals, learn from outcomes, and find similar p
 This is the foundation of the AI brain - it provides semantic memory and retrieval.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-import json
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
@@ -21,7 +22,6 @@ from qdrant_client.models import (
 )
 from sentence_transformers import SentenceTransformer
 
-from ..config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -47,9 +47,8 @@ class MemoryService:
             self.client = QdrantClient(":memory:")  # For development
             # For production: self.client = QdrantClient(host="localhost", port=6333)
 
-            # Initialize embedding model
-            logger.info(f"Loading embedding model: {self.EMBEDDING_MODEL}")
-            self.embedding_model = SentenceTransformer(self.EMBEDDING_MODEL)
+            # Initialize embedding model (already loaded if the gunicorn master preloaded it)
+            self.embedding_model = get_embedding_model()
 
             # Create collection if it doesn't exist
             self._ensure_collection_exists()
@@ -163,8 +162,8 @@ class MemoryService:
             # Generate text representation
             deal_text = self._deal_to_text(deal)
 
-            # Generate embedding
-            embedding = self._generate_embedding(deal_text)
+            # Generate embedding (CPU-bound, so off the event loop)
+            embedding = await asyncio.to_thread(self._generate_embedding, deal_text)
 
             # Prepare metadata payload
             payload = {
@@ -183,8 +182,9 @@ class MemoryService:
             if metadata:
                 payload.update(metadata)
 
-            # Store in Qdrant
-            self.client.upsert(
+            # Store in Qdrant (blocking client call)
+            await asyncio.to_thread(
+                self.client.upsert,
                 collection_name=self.COLLECTION_NAME,
                 points=[
                     PointStruct(
@@ -224,10 +224,11 @@ class MemoryService:
         try:
             # Generate text and embedding for query deal
             deal_text = self._deal_to_text(deal)
-            query_embedding = self._generate_embedding(deal_text)
+            query_embedding = await asyncio.to_thread(self._generate_embedding, deal_text)
 
-            # Search with workspace filter
-            results = self.client.search(
+            # Search with workspace filter (blocking client call)
+            results = await asyncio.to_thread(
+                self.client.search,
                 collection_name=self.COLLECTION_NAME,
                 query_vector=query_embedding,
                 query_filter=Filter(
@@ -400,13 +401,29 @@ class MemoryService:
             }
 
 
-# Singleton instance
-_memory_service: Optional[MemoryService] = None
+@lru_cache(maxsize=1)
+def get_embedding_model() -> SentenceTransformer:
+    """
+    Load the sentence transformer once per process.
+
+    The model is read-only data, so loading it in the gunicorn master before
+    forking lets every worker share its memory copy-on-write.
+    """
+    logger.info(f"Loading embedding model: {MemoryService.EMBEDDING_MODEL}")
+    return SentenceTransformer(MemoryService.EMBEDDING_MODEL)
 
 
+@lru_cache(maxsize=1)
 def get_memory_service() -> MemoryService:
-    """Get or create the memory service singleton."""
-    global _memory_service
-    if _memory_service is None:
-        _memory_service = MemoryService()
-    return _memory_service
+    """Get the process-wide memory service (one Qdrant client per process)."""
+    return MemoryService()
+
+
+async def aget_memory_service() -> MemoryService:
+    """
+    Get the process-wide memory service without blocking the event loop.
+
+    The first call opens the Qdrant client and loads the embedding model in a
+    worker thread; later calls return the cached instance.
+    """
+    return await asyncio.to_thread(get_memory_service)
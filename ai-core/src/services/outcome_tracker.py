@@ -6,7 +6,7 @@ This is Week 2 of building the AI brain - teaching it to learn from outcomes.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import statistics
 
@@ -8,7 +8,6 @@ This is THE killer feature that makes VectorOS a Revenue Intelligence Platform.
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-import statistics
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,76 @@
+"""
+Minimal async circuit breaker
+Stops calling a failing dependency for a cool-down period instead of piling on
+"""
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    - closed: calls go through; failures are counted
+    - open: after `fail_max` consecutive failures, calls fail fast with
+      CircuitOpenError for `reset_timeout` seconds
+    - half-open: after the timeout one probe call is let through (concurrent
+      callers keep failing fast until it finishes); success closes the
+      circuit, failure re-opens it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 60.0,
+        failure_exceptions: tuple[type[BaseException], ...] = (Exception,),
+    ):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False  # A half-open probe call is in flight
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Run an async callable through the breaker"""
+        state = self.state
+        if state == "open" or (state == "half_open" and self._probing):
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+
+        # No await between the check and here, so only one caller becomes the probe
+        probe = state == "half_open"
+        if probe:
+            self._probing = True
+
+        try:
+            result = await func(*args, **kwargs)
+        except self.failure_exceptions:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+            raise
+        finally:
+            if probe:
+                self._probing = False
+
+        self._failures = 0
+        self._opened_at = None
+        return result
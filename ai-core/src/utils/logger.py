@@ -1,16 +1,37 @@
 """
 Enterprise-grade structured logging with context
 """
+import atexit
 import logging
+import queue
 import sys
-from typing import Any
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+from datetime import datetime, timezone
 
+import orjson
 import structlog
-from pythonjsonlogger import jsonlogger
 
 from ..config import settings
 
+# Background thread that writes queued log records to stdout
+_queue_listener: Optional[QueueListener] = None
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Render log records as one JSON object per line using orjson"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application"""
@@ -34,23 +55,38 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
+    # Configure standard library logging. Callers only enqueue records; a
+    # listener thread does the formatting and the blocking stdout writes.
+    global _queue_listener
+    shutdown_logging()
+
     handler = logging.StreamHandler(sys.stdout)
 
     if settings.log_format == "json":
-        formatter = jsonlogger.JsonFormatter(
-            fmt="%(timestamp)s %(level)s %(name)s %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S"
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(OrjsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
 
     logging.basicConfig(
         level=getattr(logging, settings.log_level),
-        handlers=[handler],
+        handlers=[QueueHandler(log_queue)],
         force=True
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger instance"""
     return structlog.get_logger(name)
@@ -72,7 +108,7 @@ class RequestLogger:
     def __init__(self):
         self.logger = get_logger("request")
 
-    async def log_request(
+    def log_request(
         self,
         method: str,
         path: str,
@@ -80,14 +116,13 @@ class RequestLogger:
         duration_ms: float,
         **kwargs: Any
     ) -> None:
-        """Log HTTP request with metrics"""
+        """Log HTTP request with metrics (only enqueues - safe on the event loop)"""
         self.logger.info(
             "http_request",
             method=method,
             path=path,
             status_code=status_code,
             duration_ms=duration_ms,
-            timestamp=datetime.utcnow().isoformat(),
             **kwargs
         )
 
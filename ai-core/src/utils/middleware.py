@@ -0,0 +1,24 @@
+"""
+ASGI middleware helpers
+"""
+from brotli_asgi import BrotliMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class StreamAwareBrotliMiddleware(BrotliMiddleware):
+    """
+    Brotli compression (gzip for clients without br) that leaves Server-Sent Events alone
+
+    The compressor holds data back until its buffer fills, which would delay
+    every streamed event. Requests that accept text/event-stream are passed
+    through uncompressed so each event reaches the client as it is sent.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"accept" and b"text/event-stream" in value:
+                    await self.app(scope, receive, send)
+                    return
+
+        await super().__call__(scope, receive, send)
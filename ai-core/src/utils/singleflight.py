@@ -0,0 +1,70 @@
+"""
+Minimal async singleflight with a short-lived result cache
+Concurrent calls for the same key share one computation; results are reused
+for a TTL so repeated identical requests (UI polling, retries) skip the work
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesce concurrent calls per key and cache their results
+
+    - hit: a result computed less than `ttl` seconds ago is returned as is
+    - in flight: callers await the computation already running for the key
+    - miss: the caller runs the computation; its result is cached and handed
+      to every waiter (an exception is raised to all of them and not cached)
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._results: "OrderedDict[Hashable, tuple[float, T]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Return the cached/in-flight result for key, or run func to produce it"""
+        entry = self._results.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._results.move_to_end(key)
+                return result
+            del self._results[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # shield: a cancelled waiter must not cancel the shared computation
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception with no waiters isn't logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self._store(key, result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: Hashable, result: T) -> None:
+        """Insert into the result cache, evicting the least recently used entry if full"""
+        self._results[key] = (time.monotonic() + self.ttl, result)
+        self._results.move_to_end(key)
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
@@ -13,7 +13,7 @@ This is what separates VectorOS from a CRM - it's ALWAYS working.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 import sys
 import os
 from dotenv import load_dotenv
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup
+Settings are validated at import time, so required values get test defaults here
+"""
+import os
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/vectoros_test")
+os.environ.setdefault("NODE_ENV", "development")
@@ -0,0 +1,9 @@
+"""Tests for the shared Anthropic clients used by agents"""
+from src.agents._anthropic_clients import get_async_anthropic
+from src.agents.deal_intelligence import DealIntelligenceAgent
+
+
+def test_deal_intelligence_agent_builds_on_the_shared_client():
+    agent = DealIntelligenceAgent()
+
+    assert agent.llm._async_client is get_async_anthropic()
@@ -0,0 +1,29 @@
+"""Tests for the autonomous agent's DB-side candidate filters"""
+from datetime import datetime, timezone
+
+from src.agents.autonomous_agent import AutonomousAgent
+
+
+def _probability_filter(at_risk_threshold: float) -> dict:
+    filters = AutonomousAgent._candidate_filters(
+        now=datetime.now(timezone.utc),
+        stale_days=14,
+        at_risk_threshold=at_risk_threshold,
+    )
+    return next(f["probability"] for f in filters if set(f) == {"probability"})
+
+
+def test_at_risk_filter_is_int_for_int_column():
+    at_risk = _probability_filter(0.3)
+
+    assert type(at_risk["lt"]) is int
+    assert at_risk["lt"] == 30
+
+
+def test_at_risk_filter_keeps_every_deal_the_python_check_flags():
+    for threshold in (0.1, 0.25, 0.3, 0.7):
+        limit = _probability_filter(threshold)["lt"]
+        for probability in range(0, 101):
+            # _check_at_risk and _threshold_masks compare in these two forms
+            if probability / 100 < threshold or probability < threshold * 100:
+                assert probability < limit
@@ -0,0 +1,18 @@
+"""Tests for BaseAgent message helpers"""
+from langchain_anthropic.chat_models import _format_messages
+from langchain_core.messages import HumanMessage
+
+from src.agents.base_agent import BaseAgent
+
+
+def test_cached_system_message_formats_through_chat_anthropic():
+    system_message = BaseAgent._cached_system_message("You are a deal analyst.")
+
+    system, messages = _format_messages([system_message, HumanMessage(content="Analyze")])
+
+    assert system == [{
+        "type": "text",
+        "text": "You are a deal analyst.",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert messages == [{"role": "user", "content": "Analyze"}]
@@ -0,0 +1,50 @@
+"""Tests for the async circuit breaker"""
+import asyncio
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+async def _fail():
+    raise ValueError("upstream down")
+
+
+async def test_half_open_lets_a_single_probe_through_concurrent_calls():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0.01)
+    with pytest.raises(ValueError):
+        await breaker.call(_fail)
+    await asyncio.sleep(0.02)
+    assert breaker.state == "half_open"
+
+    calls = 0
+
+    async def recovering_upstream():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    results = await asyncio.gather(
+        *(breaker.call(recovering_upstream) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert results.count("ok") == 1
+    assert sum(isinstance(r, CircuitOpenError) for r in results) == 4
+    assert breaker.state == "closed"
+
+
+async def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0.01)
+    with pytest.raises(ValueError):
+        await breaker.call(_fail)
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(ValueError):
+        await breaker.call(_fail)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(_fail)